@@ -1,12 +1,17 @@
 """UI-independent orchestration for fetching and processing forecasts."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Callable, Mapping, Optional
 
+from src.application.presentation import precompute_hourly_display_values
+from src.core.cache import get_cached_processed, put_cached_processed
+from src.core.config import get_current_date
 from src.core.evaluation import process_forecast
 from src.core.locations import Location
-from src.core.weather_api import fetch_weather_data
+from src.core.weather_api import create_session, fetch_weather_data
 
 ProcessedForecast = dict[str, Any]
 FetchForecast = Callable[[Location], Optional[dict[str, Any]]]
@@ -18,6 +23,9 @@ logger = logging.getLogger(__name__)
 DOWNLOAD_ERROR = "Could not download forecast data. Check your connection and try again."
 PROCESSING_ERROR = "The forecast response did not contain usable weather data."
 UNEXPECTED_ERROR = "Could not load this forecast. Please try again."
+# Parallel forecast requests per location group, shared by every frontend so
+# all of them put the same load on api.met.no and size their pools alike.
+MAX_CONCURRENT_LOADS = 8
 
 
 @dataclass(frozen=True)
@@ -52,9 +60,13 @@ class ForecastService:
         self,
         fetch_forecast: Optional[FetchForecast] = None,
         process: Optional[ProcessForecast] = None,
+        cache_processed: bool = False,
     ) -> None:
-        self._fetch_forecast = fetch_forecast or fetch_weather_data
+        self._fetch_forecast = fetch_forecast or partial(
+            fetch_weather_data, session=create_session(pool_maxsize=MAX_CONCURRENT_LOADS)
+        )
         self._process_forecast = process or process_forecast
+        self._cache_processed = cache_processed
 
     def load_location(self, location: Location) -> LocationForecastResult:
         """Load and process a single location, converting failures to data."""
@@ -66,7 +78,7 @@ class ForecastService:
                     error=DOWNLOAD_ERROR,
                 )
 
-            processed = self._process_forecast(raw_forecast, location.name)
+            processed = self._process_location(raw_forecast, location)
             if processed is None:
                 return LocationForecastResult(
                     location=location,
@@ -77,23 +89,56 @@ class ForecastService:
             logger.exception("Unexpected forecast loading error for %s", location.name)
             return LocationForecastResult(location=location, error=UNEXPECTED_ERROR)
 
+    def _process_location(
+        self, raw_forecast: dict[str, Any], location: Location
+    ) -> Optional[ProcessedForecast]:
+        """Process a payload, reusing the on-disk result for an identical one."""
+        today = get_current_date()
+        if self._cache_processed:
+            processed = get_cached_processed(location.key, raw_forecast, today)
+            if processed is not None:
+                return processed
+        processed = self._process_forecast(raw_forecast, location.name)
+        if processed is None:
+            return None
+        precompute_hourly_display_values(processed)
+        if self._cache_processed:
+            put_cached_processed(location.key, raw_forecast, today, processed)
+        return processed
+
     def load_locations(
         self,
         locations: Mapping[str, Location],
         on_progress: Optional[ProgressCallback] = None,
+        max_workers: int = MAX_CONCURRENT_LOADS,
     ) -> ForecastBatch:
-        """Load a location group, retaining successful partial results."""
-        forecasts: dict[str, ProcessedForecast] = {}
-        errors: dict[str, str] = {}
+        """Load a location group concurrently, retaining partial results.
+
+        Progress is reported as each location finishes; the returned batch
+        keeps the group's own location order.
+        """
+        results: dict[str, LocationForecastResult] = {}
         total = len(locations)
+        if not total:
+            return ForecastBatch()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+            futures = {
+                executor.submit(self.load_location, location): location_key
+                for location_key, location in locations.items()
+            }
+            for index, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                results[futures[future]] = result
+                if on_progress:
+                    on_progress(index, total, result.location)
 
-        for index, (location_key, location) in enumerate(locations.items(), start=1):
-            result = self.load_location(location)
+        forecasts: dict[str, ProcessedForecast] = {}
+        errors: dict[str, str] = {}
+        for location_key in locations:
+            result = results[location_key]
             if result.forecast is not None:
                 forecasts[location_key] = result.forecast
             else:
                 errors[location_key] = result.error or "Unknown forecast error"
-            if on_progress:
-                on_progress(index, total, location)
-
         return ForecastBatch(forecasts=forecasts, errors=errors)
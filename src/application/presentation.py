@@ -1,7 +1,8 @@
 """UI-independent display formatting and the shared application palette."""
 
 from datetime import date, datetime
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Union
 
 from src.core.config import NumericType
 
@@ -35,6 +36,8 @@ RATING_BACKGROUNDS = {
     "Poor": "#fef2f2",
 }
 
+HOUR_LABELS = tuple(f"{hour:02d}:00" for hour in range(24))
+
 
 def get_rating_color(rating: str) -> str:
     """Return the shared foreground color for a descriptive rating."""
@@ -47,12 +50,23 @@ def get_rating_background(rating: str) -> str:
 
 
 def format_time(value: datetime) -> str:
-    """Format a forecast timestamp as a 24-hour time."""
-    return value.strftime("%H:%M")
+    """Format a forecast timestamp as a 24-hour time.
+
+    Forecast hours fall on the hour, so those labels come from a prebuilt
+    table; other times format the fields directly rather than via ``strftime``.
+    """
+    if not value.minute:
+        return HOUR_LABELS[value.hour]
+    return f"{value.hour:02d}:{value.minute:02d}"
 
 
+@lru_cache(maxsize=64)
 def format_date(value: Union[date, datetime]) -> str:
-    """Format a date for compact selectors."""
+    """Format a date for compact selectors.
+
+    The selector relabels the same forecast week on every location change,
+    so labels are cached per date.
+    """
     if isinstance(value, datetime):
         value = value.date()
     return value.strftime("%a, %d %b")
@@ -89,3 +103,35 @@ def format_wind_speed(
 ) -> str:
     """Format wind speed with one decimal place and a fallback."""
     return "N/A" if value is None else f"{value:.1f}{unit}"
+
+
+class HourlyDisplayValues(NamedTuple):
+    """Formatted weather columns for one forecast hour."""
+
+    time: str
+    temperature: str
+    wind: str
+    clouds: str
+    precipitation: str
+    precipitation_probability: str
+    humidity: str
+
+
+def hourly_display_values(hour: Any) -> HourlyDisplayValues:
+    """Return the formatted, profile-independent values for an hour."""
+    return HourlyDisplayValues(
+        format_time(hour.time),
+        format_temperature(hour.temp),
+        format_wind_speed(hour.wind),
+        format_percentage(hour.cloud_coverage),
+        format_precipitation(hour.precipitation_amount),
+        format_percentage(hour.precipitation_probability),
+        format_percentage(hour.relative_humidity),
+    )
+
+
+def precompute_hourly_display_values(processed_forecast: dict) -> None:
+    """Store formatted values on every hour of a processed forecast."""
+    for hours in processed_forecast.get("daily_forecasts", {}).values():
+        for hour in hours:
+            hour.display_values = hourly_display_values(hour)
@@ -0,0 +1,153 @@
+"""
+On-disk cache for raw and processed forecast responses.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "weather-helper"
+CACHE_TTL_SECONDS = 3600
+CACHE_MAX_AGE_SECONDS = 24 * 3600
+PROCESSED_CACHE_VERSION = 8
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+logger = logging.getLogger("weather_cache")
+
+
+def _cache_path(loc_key: str) -> Path:
+    """Return the cache file used for a location key."""
+    return CACHE_DIR / f"{loc_key}.json"
+
+
+def _validators_path(loc_key: str) -> Path:
+    """Return the file holding HTTP validators for a cached payload."""
+    return CACHE_DIR / f"{loc_key}.meta.json"
+
+
+def _processed_cache_path(loc_key: str) -> Path:
+    """Return the processed-forecast cache file used for a location key."""
+    return CACHE_DIR / f"{loc_key}.proc.pkl"
+
+
+def _payload_digest(payload: Dict[str, Any], today: date) -> str:
+    """Return a digest identifying a raw payload processed on a given day."""
+    digest = hashlib.sha1(f"{PROCESSED_CACHE_VERSION}:{today.isoformat()}:".encode())
+    digest.update(json.dumps(payload, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Write bytes to a cache file through a temporary sibling."""
+    temp_path = path.with_name(path.name + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+def get_cached(
+    loc_key: str, ttl_seconds: float = CACHE_TTL_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """Return a cached forecast payload if it is younger than the TTL."""
+    path = _cache_path(loc_key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        with path.open(encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def put_cached(
+    loc_key: str,
+    payload: Dict[str, Any],
+    validators: Optional[Dict[str, str]] = None,
+) -> None:
+    """Store a forecast payload, replacing any previous entry atomically.
+
+    ``validators`` holds the request URL and the response's ETag and/or
+    Last-Modified values, used later to revalidate a stale payload.
+    """
+    try:
+        _write_atomically(_cache_path(loc_key), json.dumps(payload).encode("utf-8"))
+        if validators:
+            _write_atomically(
+                _validators_path(loc_key), json.dumps(validators).encode("utf-8")
+            )
+        else:
+            _validators_path(loc_key).unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not cache forecast for {loc_key}: {e}")
+
+
+def get_cached_validators(loc_key: str) -> Dict[str, str]:
+    """Return the URL and HTTP validators stored with a cached payload."""
+    try:
+        with _validators_path(loc_key).open(encoding="utf-8") as cache_file:
+            validators = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def touch_cached(loc_key: str) -> None:
+    """Restart the TTL of a cached payload the server confirmed unchanged."""
+    try:
+        os.utime(_cache_path(loc_key))
+        if _validators_path(loc_key).exists():
+            os.utime(_validators_path(loc_key))
+    except OSError as e:
+        logger.warning(f"Could not refresh cached forecast for {loc_key}: {e}")
+
+
+def get_cached_processed(
+    loc_key: str, payload: Dict[str, Any], today: date
+) -> Optional[Any]:
+    """Return the processed forecast stored for this exact payload and day.
+
+    The digest is stored ahead of the forecast, so a stale snapshot is
+    rejected without unpickling its hourly data.
+    """
+    try:
+        with _processed_cache_path(loc_key).open("rb") as cache_file:
+            if pickle.load(cache_file) != _payload_digest(payload, today):
+                return None
+            return pickle.load(cache_file)
+    except Exception:
+        return None
+
+
+def put_cached_processed(
+    loc_key: str, payload: Dict[str, Any], today: date, processed: Any
+) -> None:
+    """Store a processed forecast tagged with the digest of its raw payload."""
+    try:
+        digest = _payload_digest(payload, today)
+        data = pickle.dumps(digest, PICKLE_PROTOCOL) + pickle.dumps(
+            processed, PICKLE_PROTOCOL
+        )
+        _write_atomically(_processed_cache_path(loc_key), data)
+    except Exception as e:
+        logger.warning(f"Could not cache processed forecast for {loc_key}: {e}")
+
+
+def prune_cache(max_age_seconds: int = CACHE_MAX_AGE_SECONDS) -> None:
+    """Delete cache files that have not been written or revalidated recently."""
+    cutoff = time.time() - max_age_seconds
+    try:
+        paths = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not prune cache file {path.name}: {e}")
@@ -3,10 +3,8 @@ Configuration constants and type definitions for the Weather Helper application.
 """
 
 from datetime import date, datetime
-from functools import lru_cache
 from typing import Union
-
-import pytz
+from zoneinfo import ZoneInfo
 
 # Type definitions
 NumericType = Union[int, float]
@@ -22,6 +20,7 @@ API_URL_COMPACT = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
 
 # Time zone
 TIMEZONE = "Europe/Madrid"
+APP_TIMEZONE = ZoneInfo(TIMEZONE)
 
 # Weather display settings
 FORECAST_DAYS = 7  # Max days for forecast processing
@@ -30,15 +29,14 @@ DAYLIGHT_START_HOUR = 8
 
 
 # Utility functions
-@lru_cache(maxsize=None)
-def get_timezone():
+def get_timezone() -> ZoneInfo:
     """Get the application timezone object."""
-    return pytz.timezone(TIMEZONE)
+    return APP_TIMEZONE
 
 
 def get_current_datetime() -> datetime:
     """Get the current datetime in the application timezone."""
-    return datetime.now(get_timezone())
+    return datetime.now(APP_TIMEZONE)
 
 
 def get_current_date() -> date:
@@ -3,9 +3,13 @@ Evaluation and scoring logic for weather forecasts.
 Provides functions to process forecasts, evaluate blocks, and rank locations.
 """
 
+import heapq
 import math
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Optional
 
 from src.core.config import (
@@ -15,12 +19,12 @@ from src.core.config import (
     NumericType,
     get_current_date,
     get_timezone,
-    safe_average,
 )
 from src.core.models import DailyReport, HourlyWeather
 from src.core.scoring import (
     DEFAULT_ACTIVITY_PROFILE,
     cloud_score,
+    fill_activity_scores,
     get_activity_score,
     humidity_score,
     precip_amount_score,
@@ -30,6 +34,10 @@ from src.core.scoring import (
 
 ADJACENT_FORECAST_MINUTES_MIN = 50
 ADJACENT_FORECAST_MINUTES_MAX = 70
+# Shortest and longest gaps between adjacent forecast rows, built once since
+# every ranking compares each pair of neighbouring hours against them.
+ADJACENT_MIN_DELTA = timedelta(minutes=ADJACENT_FORECAST_MINUTES_MIN)
+ADJACENT_MAX_DELTA = timedelta(minutes=ADJACENT_FORECAST_MINUTES_MAX)
 CURRENT_HOUR_RELEVANCE_MINUTE = 30
 DEFAULT_MAX_SCORE_VARIANCE = 7.0
 OPTIMAL_MAX_SCORE_VARIANCE = 8.0
@@ -43,41 +51,34 @@ WEAK_HOUR_PENALTY_WEIGHT = 0.2
 DAY_SCORE_CHANGE_TOLERANCE = 4.0
 DAY_SCORE_VOLATILITY_WEIGHT = 0.35
 MAX_DAY_VOLATILITY_PENALTY = 10.0
-
-
-def _calculate_weather_averages(
-    hours: list[HourlyWeather],
-) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
-    """Calculate average temperature, wind, humidity, and precipitation."""
-    return (
-        _average_hour_attribute(hours, "temp"),
-        _average_hour_attribute(hours, "wind"),
-        _average_hour_attribute(hours, "relative_humidity"),
-        _average_hour_attribute(hours, "precipitation_amount"),
-    )
-
-
-def _average_hour_attribute(
-    hours: list[HourlyWeather], attribute_name: str
-) -> Optional[float]:
-    """Average numeric values for a single HourlyWeather attribute."""
-    values = [
-        getattr(hour, attribute_name)
-        for hour in hours
-        if getattr(hour, attribute_name) is not None
-    ]
-    return safe_average(values)
-
-
-def _calculate_block_details(hours: list[HourlyWeather]) -> dict[str, Any]:
-    """Calculate display and risk details for a weather block."""
-    clouds = [h.cloud_coverage for h in hours if h.cloud_coverage is not None]
-    precip_probs = [h.precipitation_probability for h in hours if h.precipitation_probability is not None]
-    symbols = sorted({h.symbol_code for h in hours if h.symbol_code})
+AVERAGED_HOUR_FIELDS = (
+    "temp",
+    "wind",
+    "relative_humidity",
+    "precipitation_amount",
+    "cloud_coverage",
+    "precipitation_probability",
+)
+_averaged_hour_values = attrgetter(*AVERAGED_HOUR_FIELDS)
+
+
+def _average_hour_fields(hours: list[HourlyWeather]) -> dict[str, Optional[float]]:
+    """Average every block detail field in a single pass over the hours.
+
+    Each hour's fields are read together and added to per-field running
+    totals, skipping missing values, rather than walking the block once per
+    field.
+    """
+    totals = [0] * len(AVERAGED_HOUR_FIELDS)
+    counts = [0] * len(AVERAGED_HOUR_FIELDS)
+    for hour in hours:
+        for index, value in enumerate(_averaged_hour_values(hour)):
+            if value is not None:
+                totals[index] += value
+                counts[index] += 1
     return {
-        "cloud": safe_average(clouds),
-        "precip_probability": safe_average(precip_probs),
-        "symbols": symbols,
+        field_name: total / count if count else None
+        for field_name, total, count in zip(AVERAGED_HOUR_FIELDS, totals, counts)
     }
 
 
@@ -87,17 +88,7 @@ def _are_adjacent_forecast_hours(
 ) -> bool:
     """Return True when two forecast entries represent adjacent hourly data."""
     delta = next_hour.time - previous_hour.time
-    return _adjacent_min_delta() <= delta <= _adjacent_max_delta()
-
-
-def _adjacent_min_delta() -> timedelta:
-    """Return the shortest allowed gap between adjacent forecast rows."""
-    return timedelta(minutes=ADJACENT_FORECAST_MINUTES_MIN)
-
-
-def _adjacent_max_delta() -> timedelta:
-    """Return the longest allowed gap between adjacent forecast rows."""
-    return timedelta(minutes=ADJACENT_FORECAST_MINUTES_MAX)
+    return ADJACENT_MIN_DELTA <= delta <= ADJACENT_MAX_DELTA
 
 
 def _get_period_data(
@@ -117,21 +108,43 @@ def _is_future_or_current_hour(hour: HourlyWeather, now_local: datetime) -> bool
     """Return True when an hour is still useful for today's recommendations."""
     return (
         hour.time > now_local
-        or hour.time.hour == now_local.hour
+        or hour.hour == now_local.hour
         and now_local.minute < CURRENT_HOUR_RELEVANCE_MINUTE
     )
 
 
+def get_ranking_time_slot(now_local: datetime) -> tuple[date, int, bool]:
+    """Return the half-hour slot that decides which of today's hours rank.
+
+    Rankings made at two times in the same slot keep the same hours, so
+    frontends key their cached rankings on this slot. Later slots compare
+    greater than earlier ones.
+    """
+    return (
+        now_local.date(),
+        now_local.hour,
+        now_local.minute >= CURRENT_HOUR_RELEVANCE_MINUTE,
+    )
+
+
 def _filter_hours_for_recommendations(
-    hours: list[HourlyWeather],
+    daylight_hours: list[HourlyWeather],
     forecast_date: date,
     now_local: datetime,
 ) -> list[HourlyWeather]:
-    """Filter hours to the daytime rows still relevant for a selected date."""
-    daylight_hours = [hour for hour in hours if _is_daylight_hour(hour)]
+    """Filter a date's daytime rows to those still relevant for recommendations.
+
+    The rows are in time order and every row after a relevant one is also
+    relevant, so the first relevant row is found by bisection.
+    """
     if forecast_date != now_local.date():
         return daylight_hours
-    return [hour for hour in daylight_hours if _is_future_or_current_hour(hour, now_local)]
+    first_relevant = bisect_left(
+        daylight_hours,
+        True,
+        key=lambda hour: _is_future_or_current_hour(hour, now_local),
+    )
+    return daylight_hours[first_relevant:]
 
 
 def find_optimal_weather_block(
@@ -160,43 +173,60 @@ def _valid_minimum_duration_block(
     return block
 
 
-def _create_hourly_weather(entry: dict[str, Any]) -> HourlyWeather:
+def _create_hourly_weather(
+    entry: dict[str, Any], forecast_time: Optional[datetime] = None
+) -> HourlyWeather:
     """Create an HourlyWeather object from a forecast timeseries entry."""
-    weather_values = _extract_hourly_weather_values(entry)
+    weather_values = _extract_hourly_weather_values(entry, forecast_time)
     return _build_hourly_weather(weather_values)
 
 
-def _extract_hourly_weather_values(entry: dict[str, Any]) -> dict[str, Any]:
-    """Extract raw weather values from a timeseries entry."""
+def _extract_hourly_weather_values(
+    entry: dict[str, Any], forecast_time: Optional[datetime] = None
+) -> dict[str, Any]:
+    """Extract raw weather values, reusing an already parsed timestamp.
+
+    The 1-hour and 6-hour periods are looked up once per entry and shared by
+    the precipitation and symbol fallbacks.
+    """
     instant_details = entry["data"]["instant"]["details"]
-    precipitation_amount, precipitation_probability = _get_precipitation_values(entry)
+    next_1h_summary, next_1h_details = _get_period_data(entry, "next_1_hours")
+    next_6h_summary, next_6h_details = _get_period_data(entry, "next_6_hours")
+    precipitation_amount, precipitation_probability = _get_precipitation_values(
+        next_1h_details, next_6h_details
+    )
+    if forecast_time is None:
+        forecast_time = _parse_local_forecast_time(entry["time"])
     
     return {
-        "time": _parse_local_forecast_time(entry["time"]),
+        "time": forecast_time,
         "temp": instant_details.get("air_temperature"),
         "wind": instant_details.get("wind_speed"),
         "cloud_coverage": instant_details.get("cloud_area_fraction"),
         "precipitation_amount": precipitation_amount,
         "precipitation_probability": precipitation_probability,
-        "symbol_code": _get_symbol_code(entry),
+        "symbol_code": _get_symbol_code(next_1h_summary, next_6h_summary),
         "relative_humidity": instant_details.get("relative_humidity"),
         "water_temp": None,
         "wave_height": None,
     }
 
 
+@lru_cache(maxsize=1024)
 def _parse_local_forecast_time(timestamp: str) -> datetime:
-    """Parse an API timestamp into the application timezone."""
+    """Parse an API timestamp into the application timezone.
+
+    Every location's forecast shares the same hourly timestamps, so each one
+    is parsed and converted once per batch instead of once per location.
+    """
     time_utc = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
     return time_utc.astimezone(get_timezone())
 
 
 def _get_precipitation_values(
-    entry: dict[str, Any]
+    next_1h_details: dict[str, Any], next_6h_details: dict[str, Any]
 ) -> tuple[Optional[NumericType], Optional[NumericType]]:
     """Return amount and probability using 1-hour data with 6-hour fallback."""
-    _, next_1h_details = _get_period_data(entry, "next_1_hours")
-    _, next_6h_details = _get_period_data(entry, "next_6_hours")
     return (
         _first_available_detail(next_1h_details, next_6h_details, "precipitation_amount"),
         _first_available_detail(next_1h_details, next_6h_details, "probability_of_precipitation"),
@@ -213,16 +243,16 @@ def _first_available_detail(
     return fallback_details.get(key)
 
 
-def _get_symbol_code(entry: dict[str, Any]) -> Optional[str]:
+def _get_symbol_code(
+    next_1h_summary: dict[str, Any], next_6h_summary: dict[str, Any]
+) -> Optional[str]:
     """Return the most specific available weather symbol code."""
-    next_1h_summary, _ = _get_period_data(entry, "next_1_hours")
-    next_6h_summary, _ = _get_period_data(entry, "next_6_hours")
     return next_1h_summary.get("symbol_code") or next_6h_summary.get("symbol_code")
 
 
 def _build_hourly_weather(values: dict[str, Any]) -> HourlyWeather:
-    """Build an HourlyWeather object with component scores."""
-    return HourlyWeather(
+    """Build an HourlyWeather object with component and activity scores."""
+    hour = HourlyWeather(
         **values,
         temp_score=temp_score(values["temp"]),
         wind_score=wind_score(values["wind"]),
@@ -230,6 +260,8 @@ def _build_hourly_weather(values: dict[str, Any]) -> HourlyWeather:
         precip_amount_score=precip_amount_score(values["precipitation_amount"]),
         humidity_score=humidity_score(values["relative_humidity"]),
     )
+    fill_activity_scores(hour)
+    return hour
 
 
 def _process_timeseries(
@@ -257,7 +289,9 @@ def _append_forecast_entry(
     forecast_date = forecast_time.date()
 
     if today <= forecast_date <= end_date:
-        daily_forecasts[forecast_date].append(_create_hourly_weather(entry))
+        daily_forecasts[forecast_date].append(
+            _create_hourly_weather(entry, forecast_time)
+        )
 
 
 def process_forecast(forecast_data: dict, location_name: str) -> Optional[dict]:
@@ -316,68 +350,82 @@ def get_time_blocks_for_date(processed_forecast: dict, d: date) -> list[HourlyWe
     return sorted(processed_forecast["daily_forecasts"].get(d, []), key=lambda h: h.time)
 
 
+def has_time_blocks_for_date(processed_forecast: dict, d: date) -> bool:
+    """Return whether a processed forecast has any hourly blocks for a date."""
+    if not processed_forecast or "daily_forecasts" not in processed_forecast:
+        return False
+    return bool(processed_forecast["daily_forecasts"].get(d))
+
+
 def _find_consistent_blocks(
     sorted_hours: list[HourlyWeather],
     max_score_variance: float = DEFAULT_MAX_SCORE_VARIANCE,
     activity_profile: str = DEFAULT_ACTIVITY_PROFILE,
 ) -> list[dict[str, Any]]:
-    """Find blocks of hours with consistent scores."""
+    """Find blocks of hours with consistent scores.
+
+    Hour scores are computed once and each start hour grows its block one
+    hour at a time with a running score total. Weather averages are left to
+    the block that is finally chosen.
+    """
+    hour_scores = [get_activity_score(hour, activity_profile) for hour in sorted_hours]
+    adjacent_to_previous = _adjacent_to_previous_flags(sorted_hours)
     blocks = []
-    for block in _iter_contiguous_hour_blocks(sorted_hours):
-        block_info = _create_consistent_block_info(
-            block,
-            max_score_variance,
-            activity_profile,
+    for start_idx in range(len(sorted_hours)):
+        blocks.extend(
+            _consistent_blocks_from(
+                start_idx,
+                sorted_hours,
+                hour_scores,
+                adjacent_to_previous,
+                max_score_variance,
+                activity_profile,
+            )
         )
-        if block_info:
-            blocks.append(block_info)
     return blocks
 
 
-def _iter_contiguous_hour_blocks(
+def _consistent_blocks_from(
+    start_idx: int,
     sorted_hours: list[HourlyWeather],
-) -> list[list[HourlyWeather]]:
-    """Return every contiguous forecast block."""
-    blocks = []
-    for start_idx in range(len(sorted_hours)):
-        blocks.extend(_blocks_from_start(sorted_hours, start_idx))
-    return blocks
-
-
-def _blocks_from_start(
-    sorted_hours: list[HourlyWeather], start_idx: int
-) -> list[list[HourlyWeather]]:
-    """Return contiguous blocks that begin at a given index."""
+    hour_scores: list[NumericType],
+    adjacent_to_previous: list[bool],
+    max_score_variance: float,
+    activity_profile: str,
+) -> list[dict[str, Any]]:
+    """Return the acceptable contiguous blocks starting at one hour."""
     blocks = []
+    score_total: NumericType = 0
     for end_idx in range(start_idx, len(sorted_hours)):
-        if _has_forecast_gap(sorted_hours, start_idx, end_idx):
+        if end_idx > start_idx and not adjacent_to_previous[end_idx]:
             break
-        blocks.append(sorted_hours[start_idx : end_idx + 1])
+        score_total += hour_scores[end_idx]
+        block_length = end_idx - start_idx + 1
+        avg_score = score_total / block_length
+        if avg_score < _minimum_average_score(block_length):
+            continue
+        scores = hour_scores[start_idx:end_idx + 1]
+        std_dev = _score_standard_deviation(scores, avg_score)
+        if std_dev > _adjusted_variance_threshold(block_length, max_score_variance):
+            continue
+        blocks.append(
+            _build_block_info(
+                sorted_hours[start_idx:end_idx + 1],
+                scores,
+                avg_score,
+                std_dev,
+                activity_profile,
+            )
+        )
     return blocks
 
 
-def _has_forecast_gap(
-    sorted_hours: list[HourlyWeather], start_idx: int, end_idx: int
-) -> bool:
-    """Return True if extending a block would bridge a forecast gap."""
-    return end_idx > start_idx and not _are_adjacent_forecast_hours(
-        sorted_hours[end_idx - 1],
-        sorted_hours[end_idx],
-    )
-
-
-def _create_consistent_block_info(
-    block: list[HourlyWeather],
-    max_score_variance: float,
-    activity_profile: str,
-) -> Optional[dict[str, Any]]:
-    """Return block metadata when the block passes consistency rules."""
-    scores = [get_activity_score(hour, activity_profile) for hour in block]
-    avg_score = sum(scores) / len(scores)
-    std_dev = _score_standard_deviation(scores, avg_score)
-    if not _is_acceptable_block(block, scores, avg_score, std_dev, max_score_variance):
-        return None
-    return _build_block_info(block, avg_score, std_dev, activity_profile)
+def _adjacent_to_previous_flags(sorted_hours: list[HourlyWeather]) -> list[bool]:
+    """Return whether each hour directly follows the one before it."""
+    return [True] + [
+        _are_adjacent_forecast_hours(previous_hour, next_hour)
+        for previous_hour, next_hour in zip(sorted_hours, sorted_hours[1:])
+    ]
 
 
 def _score_standard_deviation(scores: list[NumericType], avg_score: float) -> float:
@@ -388,19 +436,6 @@ def _score_standard_deviation(scores: list[NumericType], avg_score: float) -> fl
     return variance**0.5
 
 
-def _is_acceptable_block(
-    block: list[HourlyWeather],
-    scores: list[NumericType],
-    avg_score: float,
-    std_dev: float,
-    max_score_variance: float,
-) -> bool:
-    """Return True when a block passes score and variance thresholds."""
-    if avg_score < _minimum_average_score(len(block)):
-        return False
-    return std_dev <= _adjusted_variance_threshold(len(block), max_score_variance)
-
-
 def _minimum_average_score(block_length: int) -> int:
     """Return the minimum average score allowed for a block length."""
     if block_length == 1:
@@ -416,19 +451,35 @@ def _adjusted_variance_threshold(block_length: int, max_score_variance: float) -
 
 def _build_block_info(
     block: list[HourlyWeather],
+    scores: list[NumericType],
     avg_score: float,
     std_dev: float,
     activity_profile: str,
 ) -> dict[str, Any]:
-    """Build display and ranking metadata for a consistent block."""
+    """Build the ranking metadata for a consistent block."""
     return {
         **_base_block_info(block, avg_score, std_dev),
-        **_weather_block_info(block),
-        **_calculate_block_details(block),
+        "scores": scores,
         "activity_profile": activity_profile,
     }
 
 
+def _with_weather_details(block_info: dict[str, Any]) -> dict[str, Any]:
+    """Add averaged weather and risk details to a chosen block."""
+    block = block_info["block"]
+    averages = _average_hour_fields(block)
+    return {
+        **block_info,
+        "temp": averages["temp"],
+        "wind": averages["wind"],
+        "humidity": averages["relative_humidity"],
+        "precip": averages["precipitation_amount"],
+        "cloud": averages["cloud_coverage"],
+        "precip_probability": averages["precipitation_probability"],
+        "symbols": sorted({hour.symbol_code for hour in block if hour.symbol_code}),
+    }
+
+
 def _base_block_info(
     block: list[HourlyWeather], avg_score: float, std_dev: float
 ) -> dict[str, Any]:
@@ -444,17 +495,6 @@ def _base_block_info(
     }
 
 
-def _weather_block_info(block: list[HourlyWeather]) -> dict[str, Optional[float]]:
-    """Return averaged weather fields for a block."""
-    avg_temp, avg_wind, avg_humidity, avg_precip = _calculate_weather_averages(block)
-    return {
-        "temp": avg_temp,
-        "wind": avg_wind,
-        "humidity": avg_humidity,
-        "precip": avg_precip,
-    }
-
-
 def _find_optimal_consistent_block(
     sorted_hours: list[HourlyWeather],
     activity_profile: str = DEFAULT_ACTIVITY_PROFILE,
@@ -470,7 +510,8 @@ def _find_optimal_consistent_block(
     ranked_blocks = [_rank_block(block, activity_profile) for block in candidates]
     if not ranked_blocks:
         return None
-    return max(ranked_blocks, key=lambda block: block["combined_score"])
+    best_block = max(ranked_blocks, key=lambda block: block["combined_score"])
+    return _with_weather_details(best_block)
 
 
 def _blocks_with_minimum_duration(
@@ -526,36 +567,52 @@ def _positive_hour_count(
     block_info: dict[str, Any], activity_profile: str
 ) -> int:
     """Return the number of individually positive hours in a block."""
-    return sum(
-        get_activity_score(hour, activity_profile) > 0
-        for hour in block_info["block"]
-    )
+    return sum(score > 0 for score in _block_scores(block_info, activity_profile))
 
 
 def _weak_hour_penalty(block_info: dict[str, Any], activity_profile: str) -> float:
     """Return the penalty for weak hours inside an otherwise good block."""
-    scores = [get_activity_score(hour, activity_profile) for hour in block_info["block"]]
+    scores = _block_scores(block_info, activity_profile)
     penalty = (block_info["avg_score"] - min(scores)) * WEAK_HOUR_PENALTY_WEIGHT
     return max(0.0, penalty)
 
 
+def _block_scores(
+    block_info: dict[str, Any], activity_profile: str
+) -> list[NumericType]:
+    """Return per-hour scores for a block, reusing those computed while scanning."""
+    scores = block_info.get("scores")
+    if scores is None:
+        scores = [get_activity_score(hour, activity_profile) for hour in block_info["block"]]
+    return scores
+
+
 def get_top_locations_for_date(
     all_location_processed: dict[str, dict],
     d: date,
     top_n: int = 10,
     activity_profile: str = DEFAULT_ACTIVITY_PROFILE,
+    now_local: Optional[datetime] = None,
+    cache_blocks: bool = True,
 ) -> list[dict]:
-    """Return the top N locations for a given date."""
+    """Return the top N locations for a given date.
+
+    Only the best ``top_n`` results are ordered, using a bounded heap rather
+    than sorting every ranked location. Callers ranking several dates can
+    pass one ``now_local`` so every ranking drops the same past hours.
+    Background callers pass ``cache_blocks=False`` so reports are only read,
+    leaving their optimal-block memo to the thread that owns them.
+    """
     results = []
-    now_local = datetime.now(timezone.utc).astimezone(get_timezone())
+    if now_local is None:
+        now_local = datetime.now(timezone.utc).astimezone(get_timezone())
     for loc_key, processed in all_location_processed.items():
         location_result = _rank_location_for_date(
-            loc_key, processed, d, now_local, activity_profile
+            loc_key, processed, d, now_local, activity_profile, cache_blocks
         )
         if location_result:
             results.append(location_result)
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:top_n]
+    return heapq.nlargest(top_n, results, key=lambda x: x["score"])
 
 
 def _rank_location_for_date(
@@ -564,13 +621,18 @@ def _rank_location_for_date(
     forecast_date: date,
     now_local: datetime,
     activity_profile: str,
+    cache_blocks: bool = True,
 ) -> Optional[dict[str, Any]]:
     """Return a ranked location result for a date, if data is usable."""
     report = processed.get("day_scores", {}).get(forecast_date)
     if not report:
         return None
-    filtered_hours = _location_recommendation_hours(processed, forecast_date, now_local)
-    optimal_block = _find_optimal_consistent_block(filtered_hours, activity_profile)
+    filtered_hours = _filter_hours_for_recommendations(
+        report.daylight_hours, forecast_date, now_local
+    )
+    optimal_block = _report_optimal_block(
+        report, filtered_hours, activity_profile, cache_blocks
+    )
     if not optimal_block:
         return None
     day_score = _calculate_day_activity_score(report.daylight_hours, activity_profile)
@@ -583,16 +645,28 @@ def _rank_location_for_date(
     )
 
 
-def _location_recommendation_hours(
-    processed: dict, forecast_date: date, now_local: datetime
-) -> list[HourlyWeather]:
-    """Return forecast hours considered for a location recommendation."""
-    daily_forecasts = processed.get("daily_forecasts", {})
-    return _filter_hours_for_recommendations(
-        daily_forecasts.get(forecast_date, []),
-        forecast_date,
-        now_local,
-    )
+def _report_optimal_block(
+    report: DailyReport,
+    filtered_hours: list[HourlyWeather],
+    activity_profile: str,
+    cache_blocks: bool = True,
+) -> Optional[dict[str, Any]]:
+    """Return a report's best block for the hours still ahead, computing it once.
+
+    The remaining hours are the report's hours at or after a cutoff, so
+    their count identifies them. Rankings of later days, whose hours never
+    drop out, reuse the same block every time the clock moves on.
+    """
+    cached_blocks = getattr(report, "optimal_blocks", None)
+    if not isinstance(cached_blocks, dict):
+        return _find_optimal_consistent_block(filtered_hours, activity_profile)
+    cache_key = (activity_profile, len(filtered_hours))
+    if cache_key in cached_blocks:
+        return cached_blocks[cache_key]
+    optimal_block = _find_optimal_consistent_block(filtered_hours, activity_profile)
+    if cache_blocks:
+        cached_blocks[cache_key] = optimal_block
+    return optimal_block
 
 
 def _build_location_result(
@@ -5,7 +5,8 @@ Defines HourlyWeather and DailyReport classes used throughout the application.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Any, Optional
 
 from src.core.config import NumericType, safe_average
 
@@ -15,9 +16,13 @@ PLEASANT_TEMP_C = 18
 COOL_TEMP_C = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class HourlyWeather:
-    """Represents hourly weather data with calculated scores."""
+    """Represents hourly weather data with calculated scores.
+
+    Slotted so the many per-hour objects kept for every location stay small
+    and attribute reads in the ranking loops skip the instance dict.
+    """
 
     time: datetime
     temp: Optional[NumericType] = None
@@ -38,6 +43,10 @@ class HourlyWeather:
     wave_height_score: NumericType = 0
     total_score: NumericType = field(init=False)
     hour: int = field(init=False)
+    display_values: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    activity_scores: dict[str, NumericType] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Calculate derived fields after initialization."""
@@ -66,6 +75,7 @@ class DailyReport:
         self.date = date
         self.daylight_hours = daylight_hours
         self.location_name = location_name
+        self.optimal_blocks: dict[tuple[str, int], Optional[dict[str, Any]]] = {}
 
         if not daylight_hours:
             self._initialize_empty_report()
@@ -91,9 +101,17 @@ class DailyReport:
 
     def _calculate_all_stats(self) -> None:
         """Calculate all statistics in a single pass through the data."""
-        temperatures = _valid_temperatures(self.daylight_hours)
-        total_score = sum(hour.total_score for hour in self.daylight_hours)
-        self.likely_rain_hours = _count_likely_rain_hours(self.daylight_hours)
+        temperatures: list[NumericType] = []
+        total_score: NumericType = 0
+        likely_rain_hours = 0
+        for hour in self.daylight_hours:
+            total_score += hour.total_score
+            if hour.temp is not None:
+                temperatures.append(hour.temp)
+            amount = hour.precipitation_amount
+            if isinstance(amount, (int, float)) and amount > SIGNIFICANT_RAIN_MM:
+                likely_rain_hours += 1
+        self.likely_rain_hours = likely_rain_hours
         self._set_temperature_stats(temperatures)
         self.avg_score = total_score / len(self.daylight_hours)
 
@@ -103,32 +121,19 @@ class DailyReport:
         self.max_temp = max(temperatures) if temperatures else None
         self.avg_temp = safe_average(temperatures)
 
-    @property
+    @cached_property
     def weather_description(self) -> str:
         """Get weather description based on condition hours.
 
+        A report's hours do not change after it is built, so the description
+        is worked out once and reused by every ranking and card.
+
         Returns:
             str: Description of the overall weather
         """
         return self._get_weather_description()
 
 
-def _valid_temperatures(hours: list[HourlyWeather]) -> list[NumericType]:
-    """Return non-empty temperature readings from hourly weather."""
-    return [hour.temp for hour in hours if hour.temp is not None]
-
-
-def _count_likely_rain_hours(hours: list[HourlyWeather]) -> int:
-    """Count hours with precipitation above the rain threshold."""
-    return sum(1 for hour in hours if _has_significant_rain(hour))
-
-
-def _has_significant_rain(hour: HourlyWeather) -> bool:
-    """Return True when an hour is likely rainy."""
-    amount = hour.precipitation_amount
-    return isinstance(amount, (int, float)) and amount > SIGNIFICANT_RAIN_MM
-
-
 def _describe_temperature(avg_temp: Optional[NumericType]) -> str:
     """Return a coarse description for an average temperature."""
     if avg_temp is None:
@@ -2,13 +2,14 @@
 Scoring logic and configuration for weather conditions.
 """
 
-from typing import Any, List, Optional, Tuple, Union
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from src.core.config import NumericType
 
 # Type definition for ranges: ((min, max), score)
 RangeType = Tuple[Optional[Tuple[Optional[float], Optional[float]]], Any]
-RangeBounds = Tuple[float, float]
 
 NORMALIZED_POOR_THRESHOLD = 50
 NORMALIZED_FAIR_THRESHOLD = 50
@@ -24,36 +25,24 @@ def _is_numeric(value: Any) -> bool:
     return isinstance(value, (int, float))
 
 
-def _normalize_range_bounds(
-    range_tuple: Tuple[Optional[float], Optional[float]]
-) -> RangeBounds:
-    """Convert open-ended range bounds to infinities."""
-    low, high = range_tuple
-    return (
-        float("-inf") if low is None else low,
-        float("inf") if high is None else high,
-    )
-
-
-def _value_in_range(value: NumericType, bounds: RangeBounds, inclusive: bool) -> bool:
-    """Return True when a value falls inside a configured range."""
-    low, high = bounds
-    if inclusive:
-        return low <= value <= high
-    return low <= value < high
-
-
 def _get_value_from_ranges(
     value: Optional[NumericType], ranges: List[RangeType], inclusive: bool = False
 ) -> Optional[Any]:
-    """Get a value from a list of ranges."""
+    """Get a value from a list of ranges.
+
+    Every forecast hour is scored against several range tables, so the
+    bounds are compared inline rather than normalized per entry.
+    """
     if value is None or not _is_numeric(value):
         return None
 
     for range_tuple, result_value in ranges:
         if range_tuple is None:
             return result_value
-        if _value_in_range(value, _normalize_range_bounds(range_tuple), inclusive):
+        low, high = range_tuple
+        if low is not None and value < low:
+            continue
+        if high is None or value < high or (inclusive and value == high):
             return result_value
 
     if _has_default_range(ranges):
@@ -74,6 +63,47 @@ def calculate_score(
     return _get_value_from_ranges(value, ranges, inclusive) or 0
 
 
+def _range_lookup(
+    ranges: List[RangeType], inclusive: bool = False
+) -> Callable[[Optional[NumericType]], Optional[Any]]:
+    """Return a bisect-based equivalent of ``_get_value_from_ranges`` for a table.
+
+    A first-match scan can only change its answer at the table's bounds, so
+    the answer at each bound and inside each gap between bounds is worked
+    out once; a lookup is then a single bisect instead of a scan.
+    """
+    bounds = sorted(
+        {bound for range_tuple, _ in ranges if range_tuple for bound in range_tuple
+         if bound is not None}
+    )
+    at_bound = [_get_value_from_ranges(bound, ranges, inclusive) for bound in bounds]
+    between = [
+        _get_value_from_ranges(_gap_probe(low, high), ranges, inclusive)
+        for low, high in zip([None, *bounds], [*bounds, None])
+    ]
+
+    def lookup(value: Optional[NumericType]) -> Optional[Any]:
+        if not isinstance(value, (int, float)):  # also rejects None
+            return None
+        index = bisect_left(bounds, value)
+        if index < len(bounds) and bounds[index] == value:
+            return at_bound[index]
+        if value != value:  # NaN compares unequal to every bound
+            return _get_value_from_ranges(value, ranges, inclusive)
+        return between[index]
+
+    return lookup
+
+
+def _gap_probe(low: Optional[float], high: Optional[float]) -> float:
+    """Return a value strictly inside the gap between two sorted bounds."""
+    if low is None or low == float("-inf"):
+        return (high if high is not None else 0) - 1
+    if high is None or high == float("inf"):
+        return low + 1
+    return (low + high) / 2
+
+
 # --- Activity Profiles ---
 
 ACTIVITY_HIKING = "hiking"
@@ -84,6 +114,9 @@ ACTIVITY_PROFILE_LABELS = {
     ACTIVITY_HIKING: "Hiking",
     ACTIVITY_BEACH_DAY: "Beach",
 }
+ACTIVITY_PROFILE_KEYS_BY_LABEL = {
+    label: key for key, label in ACTIVITY_PROFILE_LABELS.items()
+}
 
 
 # --- Scoring Ranges ---
@@ -258,73 +291,99 @@ NORMALIZATION_CONFIG_BY_PROFILE = {
 }
 
 
+# --- Compiled range lookups ---
+
+_TEMP_LOOKUP = _range_lookup(TEMP_RANGES, inclusive=True)
+_WIND_LOOKUP = _range_lookup(WIND_RANGES, inclusive=False)
+_CLOUD_LOOKUP = _range_lookup(CLOUD_RANGES, inclusive=False)
+_PRECIP_AMOUNT_LOOKUP = _range_lookup(PRECIP_AMOUNT_RANGES, inclusive=True)
+_HUMIDITY_LOOKUP = _range_lookup(HUMIDITY_RANGES, inclusive=True)
+_BEACH_TEMP_LOOKUP = _range_lookup(BEACH_TEMP_RANGES, inclusive=True)
+_BEACH_WIND_LOOKUP = _range_lookup(BEACH_WIND_RANGES, inclusive=False)
+_BEACH_CLOUD_LOOKUP = _range_lookup(BEACH_CLOUD_RANGES, inclusive=False)
+_BEACH_PRECIP_AMOUNT_LOOKUP = _range_lookup(BEACH_PRECIP_AMOUNT_RANGES, inclusive=True)
+_BEACH_HUMIDITY_LOOKUP = _range_lookup(BEACH_HUMIDITY_RANGES, inclusive=True)
+_PRECIP_PROBABILITY_LOOKUP = _range_lookup(PRECIP_PROBABILITY_RANGES, inclusive=True)
+_BEACH_PRECIP_PROBABILITY_LOOKUP = _range_lookup(BEACH_PRECIP_PROBABILITY_RANGES, inclusive=True)
+_RATING_LOOKUPS_BY_PROFILE = {
+    profile_key: _range_lookup(ranges)
+    for profile_key, ranges in RATING_RANGES_BY_PROFILE.items()
+}
+_DEFAULT_RATING_LOOKUP = _range_lookup(RATING_RANGES)
+
+
 # --- Scoring Functions ---
 
 def temp_score(temp: Optional[NumericType]) -> int:
     """Rate temperature for outdoor comfort on a scale of -15 to 8."""
-    return calculate_score(temp, TEMP_RANGES, inclusive=True)
+    return _TEMP_LOOKUP(temp) or 0
 
 
 def wind_score(wind_speed: Optional[NumericType]) -> int:
     """Rate wind speed comfort on a scale of -8 to 2."""
-    return calculate_score(wind_speed, WIND_RANGES, inclusive=False)
+    return _WIND_LOOKUP(wind_speed) or 0
 
 
 def cloud_score(cloud_coverage: Optional[NumericType]) -> int:
     """Rate cloud coverage for outdoor activities on a scale of -3 to 4."""
-    return calculate_score(cloud_coverage, CLOUD_RANGES, inclusive=False)
+    return _CLOUD_LOOKUP(cloud_coverage) or 0
 
 
 def precip_amount_score(amount: Optional[NumericType]) -> int:
     """Rate precipitation amount on a scale of -15 to 5."""
-    return calculate_score(amount, PRECIP_AMOUNT_RANGES, inclusive=True)
+    return _PRECIP_AMOUNT_LOOKUP(amount) or 0
 
 
 def humidity_score(relative_humidity: Optional[NumericType]) -> int:
     """Rate relative humidity for outdoor comfort on a scale of -4 to 3."""
-    return calculate_score(relative_humidity, HUMIDITY_RANGES, inclusive=True)
+    return _HUMIDITY_LOOKUP(relative_humidity) or 0
 
 
 def beach_temp_score(temp: Optional[NumericType]) -> int:
     """Rate air temperature for a beach day."""
-    return calculate_score(temp, BEACH_TEMP_RANGES, inclusive=True)
+    return _BEACH_TEMP_LOOKUP(temp) or 0
 
 
 def beach_wind_score(wind_speed: Optional[NumericType]) -> int:
     """Rate wind speed for beach comfort and open-water swimming."""
-    return calculate_score(wind_speed, BEACH_WIND_RANGES, inclusive=False)
+    return _BEACH_WIND_LOOKUP(wind_speed) or 0
 
 
 def beach_cloud_score(cloud_coverage: Optional[NumericType]) -> int:
     """Rate cloud coverage for sunbathing conditions."""
-    return calculate_score(cloud_coverage, BEACH_CLOUD_RANGES, inclusive=False)
+    return _BEACH_CLOUD_LOOKUP(cloud_coverage) or 0
 
 
 def beach_precip_amount_score(amount: Optional[NumericType]) -> int:
     """Rate precipitation for a beach day."""
-    return calculate_score(amount, BEACH_PRECIP_AMOUNT_RANGES, inclusive=True)
+    return _BEACH_PRECIP_AMOUNT_LOOKUP(amount) or 0
 
 
 def beach_humidity_score(relative_humidity: Optional[NumericType]) -> int:
     """Rate humidity for a beach day."""
-    return calculate_score(relative_humidity, BEACH_HUMIDITY_RANGES, inclusive=True)
+    return _BEACH_HUMIDITY_LOOKUP(relative_humidity) or 0
 
 
 def precip_probability_score(probability: Optional[NumericType]) -> int:
     """Rate precipitation probability for general outdoor plans."""
-    return calculate_score(probability, PRECIP_PROBABILITY_RANGES, inclusive=True)
+    return _PRECIP_PROBABILITY_LOOKUP(probability) or 0
 
 
 def beach_precip_probability_score(probability: Optional[NumericType]) -> int:
     """Rate precipitation probability for beach plans."""
-    return calculate_score(probability, BEACH_PRECIP_PROBABILITY_RANGES, inclusive=True)
+    return _BEACH_PRECIP_PROBABILITY_LOOKUP(probability) or 0
 
 
+@lru_cache(maxsize=256)
 def symbol_risk_score(
     symbol_code: Optional[str],
     profile_key: str = DEFAULT_ACTIVITY_PROFILE,
 ) -> int:
-    """Return a risk penalty based on the forecast symbol."""
+    """Return a risk penalty based on the forecast symbol.
+
+    The symbol vocabulary is small and fixed, so results are cached per
+    (symbol, profile) instead of re-scanning the risk terms for every hour.
+    """
     if not symbol_code:
         return 0
 
@@ -386,16 +445,37 @@ def get_activity_profile_label(profile_key: str) -> str:
 
 def get_activity_profile_key(label: str) -> str:
     """Return an activity profile key from its display label."""
-    for key, profile_label in ACTIVITY_PROFILE_LABELS.items():
-        if profile_label == label:
-            return key
-    return DEFAULT_ACTIVITY_PROFILE
+    return ACTIVITY_PROFILE_KEYS_BY_LABEL.get(label, DEFAULT_ACTIVITY_PROFILE)
 
 
 def get_activity_score(
     hour: Any, profile_key: str = DEFAULT_ACTIVITY_PROFILE
 ) -> NumericType:
-    """Return an hour score using the requested activity profile."""
+    """Return an hour score using the requested activity profile.
+
+    Scores stored by ``fill_activity_scores`` are read back rather than
+    recomputed; the hour itself is never modified.
+    """
+    cached_scores = getattr(hour, "activity_scores", None)
+    if isinstance(cached_scores, dict) and profile_key in cached_scores:
+        return cached_scores[profile_key]
+    return _calculate_activity_score(hour, profile_key)
+
+
+def fill_activity_scores(hour: Any) -> None:
+    """Store every activity profile's score on a freshly built hour.
+
+    Forecast processing calls this once per hour, so rankings and table
+    refreshes later only read the stored scores.
+    """
+    hour.activity_scores = {
+        profile_key: _calculate_activity_score(hour, profile_key)
+        for profile_key in ACTIVITY_PROFILE_LABELS
+    }
+
+
+def _calculate_activity_score(hour: Any, profile_key: str) -> NumericType:
+    """Score an hour for an activity profile from its weather values."""
     if profile_key == ACTIVITY_BEACH_DAY:
         return beach_day_score(
             hour.temp,
@@ -414,17 +494,23 @@ def get_activity_score(
     )
 
 
+@lru_cache(maxsize=1024)
 def get_rating_info(
     score: Union[int, float, None],
     profile_key: str = DEFAULT_ACTIVITY_PROFILE,
 ) -> str:
-    """Return standardized rating description based on score."""
+    """Return standardized rating description based on score.
+
+    Hourly scores are small integers, so every table row and ranking hits
+    the cache after the first refresh.
+    """
     if score is None:
         return "N/A"
-    ranges = RATING_RANGES_BY_PROFILE.get(profile_key, RATING_RANGES)
-    return _get_value_from_ranges(score, ranges, inclusive=False) or "N/A"
+    lookup = _RATING_LOOKUPS_BY_PROFILE.get(profile_key, _DEFAULT_RATING_LOOKUP)
+    return lookup(score) or "N/A"
 
 
+@lru_cache(maxsize=1024)
 def normalize_score(
     score: Union[int, float, None],
     profile_key: str = DEFAULT_ACTIVITY_PROFILE,
@@ -3,15 +3,26 @@ Handles API calls to fetch weather data from Met.no.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import math
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from src.core.cache import get_cached, get_cached_validators, put_cached, touch_cached
 from src.core.config import API_URL, API_URL_COMPACT, USER_AGENT
 from src.core.locations import Location
 
 REQUEST_TIMEOUT_SECONDS = 10
+SESSION_POOL_CONNECTIONS = 4
+SESSION_POOL_MAXSIZE = 16
 MIN_COMPLETE_TIMESERIES_LENGTH = 5
+HTTP_NOT_MODIFIED = 304
+# Response validator header -> conditional request header
+CONDITIONAL_REQUEST_HEADERS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
 
 # Configure logging
 logging.basicConfig(
@@ -20,22 +31,84 @@ logging.basicConfig(
 logger = logging.getLogger("weather_api")
 
 
-def _make_request(
-    url: str, location: Location, headers: Dict[str, str]
-) -> Optional[Dict[str, Any]]:
-    """Make a request to the weather API and return the JSON response."""
+def create_session(pool_maxsize: int = SESSION_POOL_MAXSIZE) -> requests.Session:
+    """Create a keep-alive session sized for concurrent forecast requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SESSION_POOL_CONNECTIONS, pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _send_request(
+    url: str,
+    location: Location,
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+) -> Optional[requests.Response]:
+    """Send a request to the weather API and return the successful response."""
+    get = session.get if session is not None else requests.get
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+        response = get(url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
+        return response
+    except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching forecast from {url} for {location.name}: {e}")
         return None
-    except (requests.exceptions.RequestException, ValueError) as e:
+
+
+def _response_json(
+    response: Optional[requests.Response], url: str, location: Location
+) -> Optional[Dict[str, Any]]:
+    """Decode a forecast response body, logging undecodable payloads."""
+    if response is None:
+        return None
+    try:
+        return response.json()
+    except ValueError as e:
         logger.error(f"Error fetching forecast from {url} for {location.name}: {e}")
         return None
 
 
+def _make_request(
+    url: str,
+    location: Location,
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+    validators: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Make a request to the weather API and return the JSON response.
+
+    When a ``validators`` dict is given, it receives the URL and validators
+    needed to revalidate a decoded response later.
+    """
+    response = _send_request(url, location, headers, session)
+    data = _response_json(response, url, location)
+    if data is not None and validators is not None:
+        validators.update(_response_validators(url, response))
+    return data
+
+
+def _response_validators(url: str, response: requests.Response) -> Dict[str, str]:
+    """Return the URL and validators needed to revalidate a response later."""
+    validators = {
+        header: response.headers[header]
+        for header in CONDITIONAL_REQUEST_HEADERS
+        if header in response.headers
+    }
+    return {"url": url, **validators} if validators else {}
+
+
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """Return If-None-Match/If-Modified-Since headers for stored validators."""
+    return {
+        request_header: validators[header]
+        for header, request_header in CONDITIONAL_REQUEST_HEADERS.items()
+        if header in validators
+    }
+
+
 def _build_forecast_url(base_url: str, location: Location) -> str:
     """Build a met.no forecast URL for a location."""
     return f"{base_url}?lat={location.lat}&lon={location.lon}"
@@ -54,21 +127,105 @@ def _has_complete_forecast(data: Optional[Dict[str, Any]]) -> bool:
     return len(_get_timeseries(data)) >= MIN_COMPLETE_TIMESERIES_LENGTH
 
 
-def fetch_weather_data(location: Location) -> Optional[Dict[str, Any]]:
+def fetch_weather_data(
+    location: Location, session: Optional[requests.Session] = None
+) -> Optional[Dict[str, Any]]:
     """Fetch weather data, falling back to compact when complete is too sparse.
 
     Args:
         location: Location object containing lat/lon coordinates
+        session: Optional shared session whose connections are reused
 
     Returns:
         JSON response with the forecast data, or None if weather request failed
     """
+    data, _ = _fetch_weather_data_with_validators(location, session)
+    return data
+
+
+def _fetch_weather_data_with_validators(
+    location: Location,
+    session: Optional[requests.Session] = None,
+    skip_url: Optional[str] = None,
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+    """Fetch weather data like fetch_weather_data, keeping its validators.
+
+    ``skip_url`` names an endpoint that already answered with a sparse
+    forecast, so only the remaining fallback is requested.
+    """
     headers = {"User-Agent": USER_AGENT}
-    complete_url = _build_forecast_url(API_URL, location)
-    data = _make_request(complete_url, location, headers)
-    
+    data: Optional[Dict[str, Any]] = None
+    validators: Dict[str, str] = {}
+    for base_url in (API_URL, API_URL_COMPACT):
+        url = _build_forecast_url(base_url, location)
+        if url == skip_url:
+            continue
+        validators = {}
+        data = _make_request(url, location, headers, session, validators)
+        if _has_complete_forecast(data):
+            break
+    return data, validators
+
+
+def _revalidate_cached_forecast(
+    location: Location, session: Optional[requests.Session] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Reuse an expired cached forecast if the API reports it unchanged.
+
+    A complete changed forecast that arrives in the same response is stored
+    and returned. A sparse one is dropped, and its URL is returned instead so
+    the caller's fallback does not request that endpoint a second time.
+    """
+    validators = get_cached_validators(location.key)
+    conditional_headers = _conditional_headers(validators)
+    url = validators.get("url")
+    if not url or not conditional_headers:
+        return None, None
+    cached = get_cached(location.key, ttl_seconds=math.inf)
+    if cached is None:
+        return None, None
+
+    headers = {"User-Agent": USER_AGENT, **conditional_headers}
+    response = _send_request(url, location, headers, session)
+    if response is None:
+        return None, None
+    if response.status_code == HTTP_NOT_MODIFIED:
+        touch_cached(location.key)
+        return cached, None
+    data = _response_json(response, url, location)
     if not _has_complete_forecast(data):
-        compact_url = _build_forecast_url(API_URL_COMPACT, location)
-        data = _make_request(compact_url, location, headers)
-        
+        return None, url
+    put_cached(location.key, data, _response_validators(url, response))
+    return data, None
+
+
+def fetch_weather_data_cached(
+    location: Location, session: Optional[requests.Session] = None
+) -> Optional[Dict[str, Any]]:
+    """Fetch weather data, reusing the on-disk copy while fresh or unchanged.
+
+    A copy younger than the cache TTL is returned without a request. An
+    older copy is revalidated with a conditional GET and reused when the
+    API answers 304 Not Modified.
+
+    Args:
+        location: Location object containing lat/lon coordinates
+        session: Optional shared session whose connections are reused
+
+    Returns:
+        JSON response with the forecast data, or None if weather request failed
+    """
+    data = get_cached(location.key)
+    if data is not None:
+        return data
+
+    data, requested_url = _revalidate_cached_forecast(location, session)
+    if data is not None:
+        return data
+
+    data, validators = _fetch_weather_data_with_validators(
+        location, session, skip_url=requested_url
+    )
+    if data is not None:
+        put_cached(location.key, data, validators)
     return data
@@ -3,18 +3,31 @@ Main GUI application class for the weather helper.
 Handles window setup and main widget initialization.
 """
 
+import logging
+import queue
 import threading
+import time
 import tkinter as tk
 import tkinter.messagebox as messagebox
 import webbrowser
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import partial
 from tkinter import ttk
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
-from src.application.forecast_service import ForecastService, UNEXPECTED_ERROR
-from src.core.config import MET_NORWAY_LICENSE_URL
+from src.application.forecast_service import (
+    MAX_CONCURRENT_LOADS,
+    UNEXPECTED_ERROR,
+    ForecastService,
+)
+from src.application.presentation import hourly_display_values
+from src.core.cache import CACHE_TTL_SECONDS, prune_cache
+from src.core.config import MET_NORWAY_LICENSE_URL, NumericType, get_current_datetime
 from src.core.evaluation import (
     get_available_dates,
+    get_ranking_time_slot,
     get_time_blocks_for_date,
     get_top_locations_for_date,
     process_forecast,
@@ -30,7 +43,7 @@ from src.core.scoring import (
     normalize_score,
 )
 from src.core.locations import LOCATIONS, LOCATION_GROUPS
-from src.core.weather_api import fetch_weather_data
+from src.core.weather_api import create_session, fetch_weather_data_cached
 from src.gui.formatting import (
     add_tooltip,
     format_date,
@@ -42,6 +55,8 @@ from src.gui.formatting import (
 )
 from src.gui.themes import COLORS, FONTS, PADDING, apply_theme, get_rating_color
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_SCREEN_WIDTH = 1400
 DEFAULT_SCREEN_HEIGHT = 900
 MIN_WINDOW_WIDTH = 1000
@@ -53,7 +68,10 @@ WINDOW_HEIGHT_MARGIN = 160
 PROGRESS_COMPLETE_PERCENT = 100
 PROGRESS_HIDE_DELAY_MS = 2000
 STARTUP_LOAD_DELAY_MS = 100
+DISPLAY_REFRESH_DELAY_MS = 80
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.1
 MAX_SIDE_PANEL_LOCATIONS = 10
+TABLE_ROW_POOL_SIZE = 24
 SIDE_PANEL_WRAP_LENGTH = 260
 RAIN_RISK_WARNING_PERCENT = 40
 RAIN_AMOUNT_WARNING_MM = 0.5
@@ -94,6 +112,11 @@ TABLE_HEADINGS = {
     "Humidity": "Humidity",
     "Score": "Profile Score",
 }
+TABLE_RATING_TAGS = {
+    rating: rating.replace(" ", "")
+    for rating in ("Excellent", "Very Good", "Good", "Fair", "Poor")
+}
+ScoredHour = tuple[tuple[str, ...], tuple[str, str], str]
 
 
 class WeatherHelperApp:
@@ -113,13 +136,27 @@ class WeatherHelperApp:
     def _init_data_storage(self):
         """Initialize data storage attributes."""
         self.all_location_processed: Dict[str, Any] = {}
+        self._top_locations_cache: Dict[tuple, list[dict]] = {}
+        self._scored_hours_cache: Dict[tuple, list[ScoredHour]] = {}
+        self._score_style_cache: Dict[tuple, tuple[str, str]] = {}
         self.selected_location_key: str = ""
         self.selected_date = None
         self.date_map: Dict[str, date] = {}
+        self._date_str_by_date: Dict[date, str] = {}
+        self._dropdown_values: Dict[Any, tuple[str, ...]] = {}
         self.loading_errors: Dict[str, str] = {}
+        self._http_session = create_session(pool_maxsize=MAX_CONCURRENT_LOADS)
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_LOADS, thread_name_prefix="forecast-fetch"
+        )
+        self._load_requests: queue.Queue = queue.Queue()
+        self._loader_thread = None
+        self._latest_loading_progress: tuple[int, float, str, dict] | None = None
+        self._loading_progress_scheduled = False
         self.forecast_service = ForecastService(
-            fetch_forecast=fetch_weather_data,
+            fetch_forecast=partial(fetch_weather_data_cached, session=self._http_session),
             process=process_forecast,
+            cache_processed=True,
         )
         self.show_scores = tk.BooleanVar(value=False)
         self.activity_profile_var = tk.StringVar(
@@ -128,10 +165,23 @@ class WeatherHelperApp:
         self.selected_activity_profile = DEFAULT_ACTIVITY_PROFILE
         self.loaded_locations: set = set()
         self.load_generation: int = 0
+        self._pending_display_refresh = None
+        self._display_batch_depth = 0
+        self._display_refresh_requested = False
+        self._display_refresh_deferred = False
+        self._last_render_key: tuple | None = None
 
         # Default to Asturias
-        self.current_locations = LOCATIONS
-        self.total_locations: int = len(self.current_locations)
+        self.current_group_name = "Asturias"
+        self._group_forecasts: Dict[str, tuple[float, dict, dict]] = {}
+        self._set_current_locations(LOCATIONS)
+
+    def _set_current_locations(self, locations: Dict[str, Any]):
+        """Set the active location dictionary and its name lookups."""
+        self.current_locations = locations
+        self.total_locations: int = len(locations)
+        self._location_keys_by_name = {loc.name: key for key, loc in locations.items()}
+        self._sorted_location_names = sorted(self._location_keys_by_name)
 
     def _setup_ui(self):
         """Setup the main UI layout and widgets."""
@@ -150,6 +200,8 @@ class WeatherHelperApp:
         x, y = self._window_position(screen_width, screen_height, window_width, window_height)
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         self.root.resizable(True, True)
+        self.root.bind("<Map>", self._on_window_mapped)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._configure_root_grid()
 
     def _screen_size(self) -> tuple[int, int]:
@@ -492,6 +544,8 @@ class WeatherHelperApp:
         """Create reusable side-panel location rows."""
         self.location_frames = []
         self.side_panel_entries = []
+        self._side_panel_label_options: Dict[Any, Dict[str, Any]] = {}
+        self._side_panel_row_keys: list[str] = [""] * MAX_SIDE_PANEL_LOCATIONS
         for index in range(MAX_SIDE_PANEL_LOCATIONS):
             entry = self._create_side_panel_entry(index)
             self.side_panel_entries.append(entry)
@@ -503,7 +557,13 @@ class WeatherHelperApp:
         name_label = self._create_name_label(loc_frame)
         score_label = self._create_score_label(loc_frame)
         details_label = self._create_details_label(loc_frame)
-        return rank_label, name_label, score_label, details_label
+        labels = (rank_label, name_label, score_label, details_label)
+        for widget in (loc_frame, *labels):
+            widget.bind(
+                "<Button-1>",
+                lambda event, row=index: self._on_side_panel_row_click(row),
+            )
+        return labels
 
     def _create_location_frame(self, index: int):
         """Create the frame for one side-panel row."""
@@ -558,6 +618,7 @@ class WeatherHelperApp:
         self._create_main_treeview(table_frame)
         self._configure_table_row_tags()
         self._configure_table_columns()
+        self._create_table_row_pool()
 
     def _create_main_content_container(self):
         """Create the main content container."""
@@ -617,47 +678,121 @@ class WeatherHelperApp:
                 stretch=config["stretch"],
             )
 
+    def _create_table_row_pool(self):
+        """Create detached hourly rows that are filled in place on refresh."""
+        self.table_row_ids: list[str] = []
+        self._table_row_contents: list[tuple[tuple[str, ...], str] | None] = []
+        self._attached_table_rows = 0
+        for index in range(TABLE_ROW_POOL_SIZE):
+            self._add_pooled_table_row(index)
+
+    def _add_pooled_table_row(self, index: int) -> str:
+        """Create one detached pooled row and return its item id."""
+        row_id = f"row{index}"
+        self.main_table.insert("", "end", iid=row_id, values=("",) * len(TABLE_COLUMNS))
+        self.main_table.detach(row_id)
+        self.table_row_ids.append(row_id)
+        self._table_row_contents.append(None)
+        return row_id
+
     def _start_data_loading(self):
-        """Start loading weather data in a background thread."""
+        """Queue a weather data load for the long-lived loader thread."""
         self._update_status("Loading weather data...")
         self.load_generation += 1
-        generation_id = self.load_generation
-        locations = dict(self.current_locations)
+        self._ensure_loader_thread()
+        self._load_requests.put((self.load_generation, dict(self.current_locations)))
 
-        loading_thread = threading.Thread(
-            target=self._load_all_forecasts_threaded,
-            args=(generation_id, locations),
-        )
-        loading_thread.daemon = True
-        loading_thread.start()
+    def _ensure_loader_thread(self):
+        """Start the background loader on first use."""
+        if self._loader_thread is not None:
+            return
+        self._loader_thread = threading.Thread(target=self._loader_loop, daemon=True)
+        self._loader_thread.start()
+
+    def _loader_loop(self):
+        """Run queued loads in order, skipping any superseded by a newer one.
+
+        A load that fails is reported as failed for its own generation, so the
+        thread stays alive for the loads queued after it. Old cache files are
+        pruned first, before any load can write to the cache directory.
+        """
+        try:
+            prune_cache()
+        except Exception:
+            logger.exception("Weather cache pruning failed")
+        while True:
+            generation_id, locations = self._load_requests.get()
+            if self._is_stale_generation(generation_id):
+                continue
+            try:
+                self._load_all_forecasts_threaded(generation_id, locations)
+            except Exception:
+                logger.exception("Weather data load %s failed", generation_id)
+                self._report_failed_load(generation_id, locations)
+
+    def _report_failed_load(self, generation_id: int, locations: dict):
+        """Finish a crashed load so the UI does not stay on its loading status."""
+        errors = {loc_key: UNEXPECTED_ERROR for loc_key in locations}
+        try:
+            self.root.after(0, self._on_loading_complete, generation_id, None, errors)
+        except Exception:
+            logger.exception("Could not report failed weather data load %s", generation_id)
 
     def _load_all_forecasts_threaded(self, generation_id: int, locations: dict):
-        """Load into generation-local state before handing results to the UI."""
-        loaded_count = 0
+        """Load into generation-local state before handing results to the UI.
+
+        Each progress update carries a snapshot of the forecasts loaded so
+        far, so the UI can show early locations before the slowest one ends.
+        """
         forecasts: dict[str, Any] = {}
         errors: dict[str, str] = {}
         total_locations = len(locations)
-        for loc_key, loc in locations.items():
-            if self._is_stale_generation(generation_id):
-                return
-            try:
-                self._queue_location_loading_status(
-                    generation_id, loc.name, loaded_count, total_locations
-                )
-                result = self._load_single_forecast(loc)
+        last_progress_time = None
+        futures = {
+            self._fetch_executor.submit(self._load_single_forecast, loc): loc_key
+            for loc_key, loc in locations.items()
+        }
+        try:
+            for loaded_count, future in enumerate(as_completed(futures), start=1):
                 if self._is_stale_generation(generation_id):
                     return
-                if result.forecast is not None:
-                    forecasts[loc_key] = result.forecast
-                else:
-                    errors[loc_key] = result.error or UNEXPECTED_ERROR
-            except Exception:
-                errors[loc_key] = UNEXPECTED_ERROR
-            loaded_count += 1
-        self.root.after(
-            0,
-            lambda: self._on_loading_complete(generation_id, forecasts, errors),
-        )
+                loc_key = futures[future]
+                self._store_forecast_result(loc_key, future, forecasts, errors)
+                now = time.monotonic()
+                if (
+                    last_progress_time is None
+                    or now - last_progress_time >= PROGRESS_UPDATE_INTERVAL_SECONDS
+                ):
+                    last_progress_time = now
+                    self._queue_location_loading_status(
+                        generation_id,
+                        locations[loc_key].name,
+                        loaded_count,
+                        total_locations,
+                        dict(forecasts),
+                    )
+        finally:
+            for future in futures:
+                future.cancel()
+        self.root.after(0, self._on_loading_complete, generation_id, forecasts, errors)
+
+    def _store_forecast_result(
+        self,
+        loc_key: str,
+        future: Any,
+        forecasts: dict[str, Any],
+        errors: dict[str, str],
+    ):
+        """Record a finished forecast request as a forecast or an error."""
+        try:
+            result = future.result()
+        except Exception:
+            errors[loc_key] = UNEXPECTED_ERROR
+            return
+        if result.forecast is not None:
+            forecasts[loc_key] = result.forecast
+        else:
+            errors[loc_key] = result.error or UNEXPECTED_ERROR
 
     def _is_stale_generation(self, generation_id: int) -> bool:
         """Return True when a background load should stop."""
@@ -669,24 +804,41 @@ class WeatherHelperApp:
         location_name: str,
         loaded_count: int,
         total_locations: int,
+        forecasts: dict[str, Any],
     ):
-        """Queue progress and status updates on the UI thread."""
+        """Queue progress, status and partial results on the UI thread.
+
+        Only the newest progress is kept, and at most one repaint is pending,
+        so a busy UI thread applies the latest value once instead of working
+        through a backlog of stale ones.
+        """
         progress = (loaded_count / total_locations) * PROGRESS_COMPLETE_PERCENT
-        self.root.after(
-            0,
-            lambda: self._show_loading_progress(
-                generation_id, progress, location_name
-            ),
-        )
+        self._latest_loading_progress = (generation_id, progress, location_name, forecasts)
+        if not self._loading_progress_scheduled:
+            self._loading_progress_scheduled = True
+            self.root.after(0, self._show_loading_progress)
 
-    def _show_loading_progress(
-        self, generation_id: int, progress: float, location_name: str
-    ):
+    def _show_loading_progress(self):
         """Apply progress only if it still belongs to the active region load."""
+        self._loading_progress_scheduled = False
+        if self._latest_loading_progress is None:
+            return
+        generation_id, progress, location_name, forecasts = self._latest_loading_progress
         if self._is_stale_generation(generation_id):
             return
         self.progress_var.set(progress)
-        self._update_status(f"Loading {location_name}...")
+        self._update_status(f"Loaded {location_name}...")
+        if len(forecasts) > len(self.loaded_locations):
+            self._show_partial_forecasts(forecasts)
+
+    def _show_partial_forecasts(self, forecasts: dict[str, Any]):
+        """Offer the locations loaded so far while the rest are still in flight."""
+        self._set_loaded_forecasts(forecasts)
+        if self.location_var.get():
+            self._set_dropdown_values(self.location_dropdown, self._loaded_location_names())
+            self._update_displays()
+        else:
+            self._populate_location_selector()
 
     def _load_single_forecast(self, loc):
         """Fetch and process a single forecast without mutating shared UI state."""
@@ -701,9 +853,22 @@ class WeatherHelperApp:
         """Handle completion of data loading."""
         if self._is_stale_generation(generation_id):
             return
+        if forecasts:
+            self._group_forecasts[self.current_group_name] = (
+                time.monotonic(),
+                forecasts,
+                errors or {},
+            )
+        self._show_loaded_forecasts(forecasts, errors)
+
+    def _show_loaded_forecasts(
+        self,
+        forecasts: dict[str, Any] | None,
+        errors: dict[str, str] | None,
+    ):
+        """Apply loaded forecasts and refresh the dependent widgets."""
         if forecasts is not None:
-            self.all_location_processed = forecasts
-            self.loaded_locations = set(forecasts)
+            self._set_loaded_forecasts(forecasts)
         if errors is not None:
             self.loading_errors = errors
         self.progress_var.set(PROGRESS_COMPLETE_PERCENT)
@@ -715,10 +880,20 @@ class WeatherHelperApp:
             self._handle_failed_loading(error_count)
         self.root.after(PROGRESS_HIDE_DELAY_MS, self.progress_bar.grid_remove)
 
+    def _set_loaded_forecasts(self, forecasts: dict[str, Any]):
+        """Replace the loaded forecasts and drop results derived from them."""
+        self.all_location_processed = forecasts
+        self._top_locations_cache = {}
+        self._scored_hours_cache = {}
+        self._score_style_cache = {}
+        self._last_render_key = None
+        self.loaded_locations = set(forecasts)
+
     def _handle_successful_loading(self, loaded_count: int, error_count: int):
         """Update UI after at least one location loaded."""
         failed_text = f" ({error_count} unavailable)" if error_count > 0 else ""
         self._update_status(f"Loaded {loaded_count} locations successfully{failed_text}")
+        self._start_top_locations_precompute()
         self._populate_location_selector()
         self.subtitle_label.config(text=f"Weather data for {loaded_count} locations")
 
@@ -737,19 +912,30 @@ class WeatherHelperApp:
         self.status_label.config(text=message)
 
     def _populate_location_selector(self):
-        """Populate the location selector with loaded data."""
+        """Populate the location selector, keeping a still-loaded selection."""
         if not self.loaded_locations:
             return
         location_names = self._loaded_location_names()
-        self.location_dropdown["values"] = location_names
+        self._set_dropdown_values(self.location_dropdown, location_names)
         if location_names:
-            self.location_var.set(location_names[0])
+            if self.location_var.get() not in location_names:
+                self.location_var.set(location_names[0])
             self.on_location_change()
 
-    def _loaded_location_names(self) -> list[str]:
+    def _loaded_location_names(self) -> tuple[str, ...]:
         """Return sorted names for successfully loaded locations."""
-        names = [self.current_locations[loc_key].name for loc_key in self.loaded_locations]
-        return sorted(names)
+        return tuple(
+            name
+            for name in self._sorted_location_names
+            if self._location_keys_by_name[name] in self.loaded_locations
+        )
+
+    def _set_dropdown_values(self, dropdown: Any, values: tuple[str, ...]):
+        """Replace a dropdown's choices, skipping the Tk call when unchanged."""
+        if self._dropdown_values.get(dropdown) == values:
+            return
+        self._dropdown_values[dropdown] = values
+        dropdown["values"] = values
 
     def on_group_change(self, event=None):
         """Handle location group selection change."""
@@ -767,57 +953,79 @@ class WeatherHelperApp:
 
     def _switch_location_group(self, group_name: str):
         """Switch the current location dictionary."""
-        self.current_locations = LOCATION_GROUPS[group_name]
-        self.total_locations = len(self.current_locations)
+        self.current_group_name = group_name
+        self._set_current_locations(LOCATION_GROUPS[group_name])
 
     def _reset_group_state(self):
         """Clear loaded data when changing location groups."""
         self.all_location_processed = {}
+        self._top_locations_cache = {}
+        self._scored_hours_cache = {}
+        self._score_style_cache = {}
+        self._last_render_key = None
         self.loaded_locations = set()
         self.loading_errors = {}
         self.selected_location_key = ""
         self.selected_date = None
         self.date_map = {}
+        self._date_str_by_date = {}
 
     def _reset_group_widgets(self):
         """Reset visible widgets when changing location groups."""
         self.location_var.set("")
-        self.location_dropdown["values"] = []
+        self._set_dropdown_values(self.location_dropdown, ())
         self.date_var.set("")
-        self.date_dropdown["values"] = []
-        self.main_table.delete(*self.main_table.get_children())
+        self._set_dropdown_values(self.date_dropdown, ())
+        self._hide_table_rows_from(0)
         self._clear_side_panel_entries()
 
     def _clear_side_panel_entries(self):
         """Clear all reusable side-panel labels."""
-        for index, (
-            rank_label,
-            name_label,
-            score_label,
-            details_label,
-        ) in enumerate(self.side_panel_entries):
-            rank_label.config(text="")
-            name_label.config(text="")
-            score_label.config(text="")
-            details_label.config(text="")
-            if index < len(self.location_frames):
-                widgets = [
-                    self.location_frames[index],
-                    rank_label,
-                    name_label,
-                    score_label,
-                    details_label,
-                ]
-                for widget in widgets:
-                    widget.configure(cursor="")
-                    widget.unbind("<Button-1>")
+        for index, labels in enumerate(self.side_panel_entries):
+            self._clear_side_panel_entry(index, *labels)
+
+    def _clear_side_panel_entry(
+        self,
+        index: int,
+        rank_label: ttk.Label,
+        name_label: ttk.Label,
+        score_label: ttk.Label,
+        details_label: ttk.Label,
+    ):
+        """Blank one side-panel row and drop its click binding."""
+        for label in (rank_label, name_label, score_label, details_label):
+            self._configure_side_panel_label(label, text="")
+        self._set_side_panel_row_key(index, "")
+
+    def _configure_side_panel_label(self, label: ttk.Label, **options: Any):
+        """Configure a side-panel label only when its options actually change."""
+        if self._side_panel_label_options.get(label) == options:
+            return
+        label.config(**options)
+        self._side_panel_label_options[label] = options
 
     def _restart_group_loading(self):
-        """Show loading UI and start fetching the selected group."""
+        """Show the selected group, fetching it unless loaded recently."""
+        cached = self._recent_group_forecasts()
+        if cached is not None:
+            self.load_generation += 1
+            self._show_loaded_forecasts(*cached)
+            return
         self.progress_bar.grid()
         self.subtitle_label.config(text="Loading weather data...")
         self._start_data_loading()
 
+    def _recent_group_forecasts(self) -> tuple[dict, dict] | None:
+        """Return this session's forecasts for the current group if still fresh."""
+        cached = self._group_forecasts.get(self.current_group_name)
+        if cached is None:
+            return None
+        loaded_at, forecasts, errors = cached
+        if time.monotonic() - loaded_at > CACHE_TTL_SECONDS:
+            del self._group_forecasts[self.current_group_name]
+            return None
+        return forecasts, errors
+
     def on_location_change(self, event=None):
         """Handle location selection change."""
         try:
@@ -829,36 +1037,25 @@ class WeatherHelperApp:
                 self._update_status(f"Location '{selected_name}' not found")
                 return
             previous_date = self.selected_date
-            self._populate_date_selector()
-            self._restore_previous_date(previous_date)
-            self._update_displays()
+            with self._batched_display_updates():
+                self._populate_date_selector()
+                self._restore_previous_date(previous_date)
+                self._update_displays()
             self._update_status(f"Selected {selected_name}")
         except Exception as e:
             self._update_status(f"Error changing location: {str(e)}")
 
     def _location_key_for_name(self, selected_name: str) -> str:
         """Return the location key matching a display name."""
-        return next(
-            (key for key, loc in self.current_locations.items() if loc.name == selected_name),
-            "",
-        )
+        return self._location_keys_by_name.get(selected_name, "")
 
     def _restore_previous_date(self, previous_date):
         """Restore previous date selection if it exists for the new location."""
-        if not previous_date or previous_date not in self.date_map.values():
-            return
-        date_str = self._date_string_for_value(previous_date)
+        date_str = self._date_str_by_date.get(previous_date) if previous_date else None
         if date_str:
             self.date_var.set(date_str)
             self.selected_date = previous_date
 
-    def _date_string_for_value(self, selected_date):
-        """Return the selector string for a date value."""
-        return next(
-            (date_str for date_str, date_obj in self.date_map.items() if date_obj == selected_date),
-            None,
-        )
-
     def _populate_date_selector(self):
         """Populate the date selector."""
         try:
@@ -879,14 +1076,16 @@ class WeatherHelperApp:
 
     def _clear_date_selector(self):
         """Clear date selector values and map."""
-        self.date_dropdown["values"] = []
+        self._set_dropdown_values(self.date_dropdown, ())
         self.date_map = {}
+        self._date_str_by_date = {}
 
     def _set_available_dates(self, available_dates: list[date]):
         """Populate date selector with available forecast dates."""
         self.date_map = {format_date(d): d for d in available_dates}
-        date_strings = list(self.date_map.keys())
-        self.date_dropdown["values"] = date_strings
+        self._date_str_by_date = {d: date_str for date_str, d in self.date_map.items()}
+        date_strings = tuple(self.date_map)
+        self._set_dropdown_values(self.date_dropdown, date_strings)
         if date_strings:
             self.date_var.set(date_strings[0])
             self.on_date_change()
@@ -920,44 +1119,208 @@ class WeatherHelperApp:
         except Exception as e:
             self._update_status(f"Error changing activity: {str(e)}")
 
+    @contextmanager
+    def _batched_display_updates(self):
+        """Collapse display updates requested inside the block into one."""
+        self._display_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._display_batch_depth -= 1
+            if self._display_batch_depth == 0 and self._display_refresh_requested:
+                self._display_refresh_requested = False
+                self._update_displays()
+
     def _update_displays(self):
-        """Update both side panel and main table."""
+        """Schedule one refresh of both panels, coalescing rapid selector changes."""
+        if self._display_batch_depth:
+            self._display_refresh_requested = True
+            return
+        if self._pending_display_refresh is not None:
+            self.root.after_cancel(self._pending_display_refresh)
+        self._pending_display_refresh = self.root.after(
+            DISPLAY_REFRESH_DELAY_MS, self._refresh_displays
+        )
+
+    def _refresh_displays(self):
+        """Update both side panel and main table unless nothing they show changed.
+
+        While the window is minimized or withdrawn the repaint is deferred
+        until it is mapped again.
+        """
+        self._pending_display_refresh = None
+        if not self.root.winfo_viewable():
+            self._display_refresh_deferred = True
+            return
+        now = get_current_datetime()
+        render_key = self._render_key(now)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
         try:
-            self._update_side_panel()
+            self._update_side_panel(now)
             self._update_main_table()
         except Exception as e:
+            self._last_render_key = None
             self._update_status(f"Error updating displays: {str(e)}")
 
+    def _on_window_mapped(self, event: tk.Event):
+        """Run a repaint that was deferred while the window was hidden."""
+        if event.widget is self.root and self._display_refresh_deferred:
+            self._display_refresh_deferred = False
+            self._update_displays()
+
+    def _on_close(self):
+        """Abandon pending loads and release the fetch workers before exiting."""
+        self.load_generation += 1
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._http_session.close()
+        self.root.destroy()
+
+    def _render_key(self, now: datetime) -> tuple:
+        """Return the selection state that determines both panels' contents."""
+        return (
+            self.selected_location_key,
+            self.show_scores.get(),
+            *self._top_locations_cache_key(
+                self.selected_date, self.selected_activity_profile, now
+            ),
+        )
+
     def _get_side_panel_title(self) -> str:
         """Return the current side panel title."""
         activity_label = get_activity_profile_label(self.selected_activity_profile)
         return f"Top 10 for {activity_label}"
 
-    def _update_side_panel(self):
-        """Update the side panel."""
-        self._clear_side_panel_entries()
-        if not self.selected_date:
-            return
+    def _update_side_panel(self, now: Optional[datetime] = None):
+        """Update the side panel in place, blanking rows without a location."""
+        top_locations = []
         try:
-            top_locations = self._top_locations_for_selected_date()
+            if self.selected_date:
+                top_locations = self._top_locations_for_selected_date(now)
             self._populate_side_panel_entries(top_locations)
         except Exception as e:
             self._update_status(f"Error updating side panel: {str(e)}")
 
-    def _top_locations_for_selected_date(self) -> list[dict]:
-        """Return ranked locations for the selected date."""
-        return get_top_locations_for_date(
-            self.all_location_processed,
-            self.selected_date,
-            top_n=MAX_SIDE_PANEL_LOCATIONS,
-            activity_profile=self.selected_activity_profile,
+    def _top_locations_for_selected_date(
+        self, now: Optional[datetime] = None
+    ) -> list[dict]:
+        """Return ranked locations for the selected date, reusing recent results.
+
+        A refresh passes the time it already read for its render key, so the
+        key and the ranking agree on which hours have passed.
+        """
+        if now is None:
+            now = get_current_datetime()
+        cache_key = self._top_locations_cache_key(
+            self.selected_date, self.selected_activity_profile, now
+        )
+        if cache_key not in self._top_locations_cache:
+            self._cache_top_locations(
+                self._top_locations_cache,
+                cache_key,
+                get_top_locations_for_date(
+                    self.all_location_processed,
+                    self.selected_date,
+                    top_n=MAX_SIDE_PANEL_LOCATIONS,
+                    activity_profile=self.selected_activity_profile,
+                    now_local=now,
+                ),
+            )
+        return self._top_locations_cache[cache_key]
+
+    def _cache_top_locations(
+        self, cache: Dict[tuple, list[dict]], cache_key: tuple, ranking: list[dict]
+    ):
+        """Store a ranking and drop those ranked in earlier half hours.
+
+        Rankings from a passed time slot are never looked up again, so a
+        long session keeps at most one slot's worth of rankings.
+        """
+        time_slot = cache_key[-1]
+        for old_key in [key for key in cache if key[-1] < time_slot]:
+            del cache[old_key]
+        cache.setdefault(cache_key, ranking)
+
+    def _top_locations_cache_key(
+        self, forecast_date: date, activity_profile: str, now: datetime
+    ) -> tuple:
+        """Return the inputs that determine a side-panel ranking.
+
+        Today's ranking drops hours that have passed, so the key ends with
+        the current half-hour slot. Callers pass the same ``now`` to the
+        ranking so both agree on which hours remain.
+        """
+        return (forecast_date, activity_profile, get_ranking_time_slot(now))
+
+    def _start_top_locations_precompute(self):
+        """Rank every loaded date in the background for the current activity."""
+        precompute_thread = threading.Thread(
+            target=self._precompute_top_locations,
+            args=(
+                self.load_generation,
+                self.all_location_processed,
+                self._top_locations_cache,
+                self.selected_activity_profile,
+            ),
         )
+        precompute_thread.daemon = True
+        precompute_thread.start()
+
+    def _precompute_top_locations(
+        self,
+        generation_id: int,
+        forecasts: Dict[str, Any],
+        cache: Dict[tuple, list[dict]],
+        activity_profile: str,
+    ):
+        """Rank all dates off the UI thread and hand the results back to it.
+
+        The worker only reads the forecasts; the rankings are stored by
+        ``_store_precomputed_top_locations`` on the UI thread.
+        """
+        forecast_dates = sorted(
+            {d for processed in forecasts.values() for d in get_available_dates(processed)}
+        )
+        now = get_current_datetime()
+        rankings: Dict[tuple, list[dict]] = {}
+        for forecast_date in forecast_dates:
+            if cache is not self._top_locations_cache:
+                return
+            cache_key = self._top_locations_cache_key(forecast_date, activity_profile, now)
+            if cache_key not in cache:
+                rankings[cache_key] = get_top_locations_for_date(
+                    forecasts,
+                    forecast_date,
+                    top_n=MAX_SIDE_PANEL_LOCATIONS,
+                    activity_profile=activity_profile,
+                    now_local=now,
+                    cache_blocks=False,
+                )
+        if rankings:
+            self.root.after(
+                0, self._store_precomputed_top_locations, generation_id, cache, rankings
+            )
+
+    def _store_precomputed_top_locations(
+        self,
+        generation_id: int,
+        cache: Dict[tuple, list[dict]],
+        rankings: Dict[tuple, list[dict]],
+    ):
+        """Keep background rankings unless newer forecasts replaced their cache."""
+        if self._is_stale_generation(generation_id) or cache is not self._top_locations_cache:
+            return
+        for cache_key, ranking in rankings.items():
+            self._cache_top_locations(cache, cache_key, ranking)
 
     def _populate_side_panel_entries(self, top_locations: list[dict]):
         """Populate reusable side-panel rows from ranked locations."""
         for index, labels in enumerate(self.side_panel_entries):
             if index < len(top_locations):
                 self._populate_location_entry(index + 1, top_locations[index], *labels)
+            else:
+                self._clear_side_panel_entry(index, *labels)
 
     def _populate_location_entry(
         self,
@@ -969,27 +1332,36 @@ class WeatherHelperApp:
         details_label: ttk.Label,
     ):
         """Populate a single location entry in the side panel."""
-        rank_label.config(text=f"#{rank}")
-        name_label.config(text=loc_data["location_name"])
+        self._configure_side_panel_label(rank_label, text=f"#{rank}")
+        self._configure_side_panel_label(name_label, text=loc_data["location_name"])
         score_text, color = self._format_location_score(loc_data)
-        score_label.config(text=score_text, foreground=color)
-        details_label.config(text=self._format_location_details(loc_data))
-        self._bind_location_entry_selection(rank, loc_data)
-
-    def _bind_location_entry_selection(
-        self, rank: int, loc_data: Dict[str, Any]
-    ) -> None:
-        """Make a populated Top-10 row select its associated location."""
-        location_key = loc_data.get("location_key")
-        if not location_key or not 1 <= rank <= len(self.location_frames):
+        self._configure_side_panel_label(score_label, text=score_text, foreground=color)
+        self._configure_side_panel_label(
+            details_label, text=self._format_location_details(loc_data)
+        )
+        self._set_side_panel_row_key(rank - 1, loc_data.get("location_key") or "")
+
+    def _set_side_panel_row_key(self, index: int, location_key: str) -> None:
+        """Point a Top-10 row at a location, or make it inert when blank.
+
+        Click handlers are bound once per row, so a new location only costs a
+        cursor change when the row switches between blank and filled.
+        """
+        if not 0 <= index < min(len(self.location_frames), len(self.side_panel_entries)):
             return
-        widgets = [self.location_frames[rank - 1], *self.side_panel_entries[rank - 1]]
-        for widget in widgets:
-            widget.configure(cursor="hand2")
-            widget.bind(
-                "<Button-1>",
-                lambda event, key=location_key: self._select_side_panel_location(key),
-            )
+        previous_key = self._side_panel_row_keys[index]
+        self._side_panel_row_keys[index] = location_key
+        if bool(previous_key) == bool(location_key):
+            return
+        cursor = "hand2" if location_key else ""
+        for widget in (self.location_frames[index], *self.side_panel_entries[index]):
+            widget.configure(cursor=cursor)
+
+    def _on_side_panel_row_click(self, index: int) -> None:
+        """Select the location currently shown in a clicked Top-10 row."""
+        location_key = self._side_panel_row_keys[index]
+        if location_key:
+            self._select_side_panel_location(location_key)
 
     def _select_side_panel_location(self, location_key: str) -> None:
         """Select a location from a clickable Top-10 row."""
@@ -1006,20 +1378,30 @@ class WeatherHelperApp:
             "activity_profile",
             self.selected_activity_profile,
         )
-        rating = get_rating_info(total_score, activity_profile)
-        normalized = normalize_score(total_score, activity_profile)
-        activity_label = f"{get_activity_profile_label(activity_profile)} day"
-        score_text = self._score_text(activity_label, normalized, total_score, rating)
-        return score_text, get_rating_color(rating)
-
-    def _score_text(
-        self, activity_label: str, normalized: int, total_score: Any, rating: str
-    ) -> str:
-        """Return score text according to score-visibility settings."""
-        score_text = f"{activity_label}: {normalized}/100"
-        if self.show_scores.get():
-            return score_text + f" (Raw: {total_score:.1f}, {rating})"
-        return score_text + f" ({rating})"
+        return self._location_score_style(
+            total_score, activity_profile, bool(self.show_scores.get())
+        )
+
+    def _location_score_style(
+        self, total_score: NumericType, activity_profile: str, show_scores: bool
+    ) -> tuple[str, str]:
+        """Return Top-10 score text and rating color for a ranked score.
+
+        Each refresh re-renders the same ranked scores, so the rating, 0-100
+        score and label lookups are kept per score and toggle state until new
+        forecasts load.
+        """
+        cache_key = (total_score, activity_profile, show_scores)
+        if cache_key not in self._score_style_cache:
+            rating = get_rating_info(total_score, activity_profile)
+            normalized = normalize_score(total_score, activity_profile)
+            score_text = f"{get_activity_profile_label(activity_profile)} day: {normalized}/100"
+            if show_scores:
+                score_text += f" (Raw: {total_score:.1f}, {rating})"
+            else:
+                score_text += f" ({rating})"
+            self._score_style_cache[cache_key] = (score_text, get_rating_color(rating))
+        return self._score_style_cache[cache_key]
 
     def _format_location_details(self, loc_data: Dict[str, Any]) -> str:
         """Return side-panel detail text for one location."""
@@ -1045,55 +1427,94 @@ class WeatherHelperApp:
 
     def _update_main_table(self):
         """Update the main table with data for the selected location."""
-        self.main_table.delete(*self.main_table.get_children())
-        if not self.selected_location_key or not self.selected_date:
-            return
+        rows = []
         try:
-            processed = self._selected_processed_forecast()
-            if not processed:
-                return
-            time_blocks = get_time_blocks_for_date(processed, self.selected_date)
-            for block in time_blocks:
-                self._insert_hourly_table_row(block)
+            if self.selected_location_key and self.selected_date:
+                show_scores = bool(self.show_scores.get())
+                rows = [
+                    ((*weather_values, score_labels[show_scores]), tag)
+                    for weather_values, score_labels, tag in self._scored_hours_for_selection()
+                ]
+            for index, (values, tag) in enumerate(rows):
+                self._show_hourly_table_row(index, values, tag)
         except Exception as e:
             self._update_status(f"Error updating table: {str(e)}")
+        self._hide_table_rows_from(len(rows))
 
-    def _insert_hourly_table_row(self, block: Any):
-        """Insert one hourly weather row."""
-        self.main_table.insert(
-            "",
-            "end",
-            values=self._hourly_row_values(block),
-            tags=(self._rating_tag_for_block(block),),
-        )
+    def _scored_hours_for_selection(self) -> list[ScoredHour]:
+        """Return the selected day's hourly cells, score labels and row tags.
 
-    def _hourly_row_values(self, block: Any) -> tuple[str, ...]:
-        """Return formatted hourly table values."""
-        return (
-            format_time(block.time),
-            format_temperature(block.temp),
-            format_wind_speed(block.wind),
-            format_percentage(block.cloud_coverage),
-            format_precipitation(block.precipitation_amount),
-            format_percentage(block.precipitation_probability),
-            format_percentage(block.relative_humidity),
-            self._format_profile_score(block),
+        Both score column labels are formatted up front and kept until new
+        forecasts load, so toggling raw scores or returning to an earlier
+        selection formats nothing.
+        """
+        cache_key = (
+            self.selected_location_key,
+            self.selected_date,
+            self.selected_activity_profile,
         )
+        if cache_key not in self._scored_hours_cache:
+            processed = self._selected_processed_forecast()
+            time_blocks = (
+                get_time_blocks_for_date(processed, self.selected_date) if processed else []
+            )
+            formatters = (
+                self._profile_score_formatter(False),
+                self._profile_score_formatter(True),
+            )
+            self._scored_hours_cache[cache_key] = [
+                self._scored_hour(block, formatters) for block in time_blocks
+            ]
+        return self._scored_hours_cache[cache_key]
 
-    def _rating_tag_for_block(self, block: Any) -> str:
-        """Return the Treeview color tag for a weather row."""
+    def _scored_hour(
+        self,
+        block: Any,
+        formatters: tuple[Callable[[NumericType, str], str], Callable[[NumericType, str], str]],
+    ) -> ScoredHour:
+        """Return an hour's weather cells, compact and detailed score labels and tag."""
         score = get_activity_score(block, self.selected_activity_profile)
         rating = get_rating_info(score, self.selected_activity_profile)
-        return rating.replace(" ", "")
-
-    def _format_profile_score(self, block: Any) -> str:
-        """Format the selected activity score for the hourly table."""
-        score = get_activity_score(block, self.selected_activity_profile)
-        normalized = normalize_score(score, self.selected_activity_profile)
-        if self.show_scores.get():
-            rating = get_rating_info(score, self.selected_activity_profile)
-            return f"{normalized}/100 ({score:.1f}, {rating})"
-        return f"{normalized}/100"
+        weather_values = block.display_values or hourly_display_values(block)
+        score_labels = (formatters[0](score, rating), formatters[1](score, rating))
+        return weather_values, score_labels, TABLE_RATING_TAGS.get(rating, rating)
+
+    def _show_hourly_table_row(self, index: int, values: tuple[str, ...], tag: str):
+        """Fill a pooled row with one hour of weather and attach it in order.
+
+        This runs for every visible row on each refresh, so it issues the
+        Treeview ``item`` and ``move`` commands directly, and only when the
+        row's contents or position actually change. Tk receives the tuples
+        as native lists, skipping ttk's option formatting and result parsing.
+        """
+        if index < len(self.table_row_ids):
+            row_id = self.table_row_ids[index]
+        else:
+            row_id = self._add_pooled_table_row(index)
+        tk_call = self.main_table.tk.call
+        if self._table_row_contents[index] != (values, tag):
+            tk_call(self.main_table, "item", row_id, "-values", values, "-tags", (tag,))
+            self._table_row_contents[index] = (values, tag)
+        if index >= self._attached_table_rows:
+            tk_call(self.main_table, "move", row_id, "", index)
+            self._attached_table_rows = index + 1
+
+    def _hide_table_rows_from(self, index: int):
+        """Detach pooled rows that are not needed for the current selection."""
+        for row_id in self.table_row_ids[index:]:
+            self.main_table.detach(row_id)
+        self._attached_table_rows = min(self._attached_table_rows, index)
+
+    def _profile_score_formatter(
+        self, show_scores: bool
+    ) -> Callable[[NumericType, str], str]:
+        """Return the Profile Score column formatter for the score toggle."""
+        profile = self.selected_activity_profile
+        if show_scores:
+            return lambda score, rating: (
+                f"{normalize_score(score, profile)}/100 ({score:.1f}, {rating})"
+            )
+        return lambda score, _rating: f"{normalize_score(score, profile)}/100"
 
     def _build_block_reason(self, best_block: dict[str, Any]) -> str:
         """Build a short human-readable reason for a recommended block."""
@@ -18,25 +18,49 @@ TOOLTIP_OFFSET_X = 20
 TOOLTIP_OFFSET_Y = 20
 TOOLTIP_WRAP_LENGTH = 300
 TOOLTIP_BORDER_WIDTH = 1
+TOOLTIP_DELAY_MS = 300
 
 
 class ToolTip:
-    """Simple tooltip implementation for GUI widgets."""
+    """Simple tooltip implementation for GUI widgets.
+
+    The tooltip appears only once the pointer has rested on the widget for
+    ``TOOLTIP_DELAY_MS``, so sweeping across widgets shows nothing. Its
+    window is created on first display and then only hidden and shown
+    again, so repeated hovers skip building a new toplevel window.
+    """
 
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
         self.tooltip_window = None
+        self.tooltip_label = None
+        self.visible = False
+        self.pending_show = None
         self.widget.bind("<Enter>", self.on_enter)
         self.widget.bind("<Leave>", self.on_leave)
 
     def on_enter(self, event=None):
-        """Show tooltip on mouse enter."""
-        if self.tooltip_window:
+        """Schedule the tooltip to show if the pointer stays on the widget."""
+        if self.visible or self.pending_show is not None:
+            return
+        self.pending_show = self.widget.after(TOOLTIP_DELAY_MS, self.show)
+
+    def show(self):
+        """Show the tooltip next to the widget."""
+        self.pending_show = None
+        if self.visible:
             return
         x, y = self._tooltip_position()
-        self.tooltip_window = self._create_tooltip_window(x, y)
-        self._create_tooltip_label(self.tooltip_window).pack(ipadx=1)
+        if self.tooltip_window is None:
+            self.tooltip_window = self._create_tooltip_window(x, y)
+            self.tooltip_label = self._create_tooltip_label(self.tooltip_window)
+            self.tooltip_label.pack(ipadx=1)
+        else:
+            self.tooltip_label.configure(text=self.text)
+            self.tooltip_window.wm_geometry(f"+{x}+{y}")
+            self.tooltip_window.deiconify()
+        self.visible = True
 
     def _tooltip_position(self) -> tuple[int, int]:
         """Return screen coordinates for the tooltip."""
@@ -72,10 +96,13 @@ class ToolTip:
         )
 
     def on_leave(self, event=None):
-        """Hide tooltip on mouse leave."""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        """Hide tooltip on mouse leave, keeping its window for the next hover."""
+        if self.pending_show is not None:
+            self.widget.after_cancel(self.pending_show)
+            self.pending_show = None
+        if self.visible:
+            self.tooltip_window.withdraw()
+            self.visible = False
 
 
 def add_tooltip(widget, text):
@@ -13,7 +13,11 @@ from src.application.presentation import (
 from src.core.config import MET_NORWAY_LICENSE_URL, MET_NORWAY_SOURCE_URL
 from src.core.locations import LOCATION_GROUPS
 from src.core.scoring import ACTIVITY_PROFILE_LABELS
-from src.mobile.view_model import MobileWeatherViewModel, RankedLocationView
+from src.mobile.view_model import (
+    HourlyForecastView,
+    MobileWeatherViewModel,
+    RankedLocationView,
+)
 
 BACKGROUND_COLOR = BASE_COLORS["background"]
 SURFACE_COLOR = BASE_COLORS["surface"]
@@ -143,6 +147,95 @@ def create_mobile_app(
 
     # --- Details rendering ---
 
+    # Row controls are kept per immutable view, so re-rendering an unchanged
+    # ranking or day hands Flet the same controls instead of new trees.
+    ranking_rows: dict[RankedLocationView, Any] = {}
+    hourly_rows: dict[HourlyForecastView, Any] = {}
+
+    def recycled(cache: dict, view: Any, build: Any) -> Any:
+        control = cache.get(view)
+        if control is None:
+            control = cache[view] = build(view)
+        return control
+
+    def hourly_row(row: HourlyForecastView) -> ft.Container:
+        return ft.Container(
+            padding=ft.Padding(left=0, top=10, right=12, bottom=10),
+            bgcolor=SURFACE_COLOR,
+            border_radius=10,
+            content=ft.Row(
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=0,
+                controls=[
+                    # Color accent bar on the left
+                    ft.Container(
+                        width=5,
+                        height=70,
+                        bgcolor=rating_color(row.rating),
+                        border_radius=ft.BorderRadius(
+                            top_left=10, bottom_left=10,
+                            top_right=0, bottom_right=0,
+                        ),
+                    ),
+                    ft.Container(width=10),
+                    # Weather info
+                    ft.Column(
+                        expand=True,
+                        spacing=2,
+                        controls=[
+                            ft.Text(
+                                row.time,
+                                size=17,
+                                weight=ft.FontWeight.BOLD,
+                                color=TEXT_COLOR,
+                            ),
+                            ft.Row(
+                                spacing=4,
+                                controls=[
+                                    _get_temp_icon(ft, row.temperature),
+                                    ft.Text(f"{row.temperature}", size=14, color=TEXT_COLOR),
+                                    ft.Container(width=8),
+                                    _get_wind_icon(ft, row.wind),
+                                    ft.Text(f"{row.wind}", size=14, color=TEXT_COLOR),
+                                ],
+                            ),
+                            ft.Row(
+                                spacing=4,
+                                controls=[
+                                    _get_cloud_icon(ft, row.clouds),
+                                    ft.Text(f"{row.clouds}", size=13, color=TEXT_SECONDARY_COLOR),
+                                    ft.Container(width=4),
+                                    _get_rain_icon(ft, row.precipitation),
+                                    ft.Text(f"{row.precipitation}", size=13, color=TEXT_SECONDARY_COLOR),
+                                    ft.Container(width=4),
+                                    _get_humidity_icon(ft, row.humidity),
+                                    ft.Text(f"{row.humidity}", size=13, color=TEXT_SECONDARY_COLOR),
+                                ],
+                            ),
+                        ],
+                    ),
+                    # Score badge
+                    ft.Column(
+                        horizontal_alignment=ft.CrossAxisAlignment.END,
+                        spacing=0,
+                        controls=[
+                            ft.Text(
+                                f"{row.normalized_score}",
+                                size=20,
+                                weight=ft.FontWeight.BOLD,
+                                color=rating_color(row.rating),
+                            ),
+                            ft.Text(
+                                row.rating,
+                                size=11,
+                                color=rating_color(row.rating),
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        )
+
     def render_details(card: RankedLocationView) -> None:
         color = rating_color(card.rating)
         bg = rating_background(card.rating)
@@ -229,85 +322,7 @@ def create_mobile_app(
         ]
 
         rows = model.hourly_forecast(card.location_key)
-        hourly.controls = [
-            ft.Container(
-                padding=ft.Padding(left=0, top=10, right=12, bottom=10),
-                bgcolor=SURFACE_COLOR,
-                border_radius=10,
-                content=ft.Row(
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=0,
-                    controls=[
-                        # Color accent bar on the left
-                        ft.Container(
-                            width=5,
-                            height=70,
-                            bgcolor=rating_color(row.rating),
-                            border_radius=ft.BorderRadius(
-                                top_left=10, bottom_left=10,
-                                top_right=0, bottom_right=0,
-                            ),
-                        ),
-                        ft.Container(width=10),
-                        # Weather info
-                        ft.Column(
-                            expand=True,
-                            spacing=2,
-                            controls=[
-                                ft.Text(
-                                    row.time,
-                                    size=17,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=TEXT_COLOR,
-                                ),
-                                ft.Row(
-                                    spacing=4,
-                                    controls=[
-                                        _get_temp_icon(ft, row.temperature),
-                                        ft.Text(f"{row.temperature}", size=14, color=TEXT_COLOR),
-                                        ft.Container(width=8),
-                                        _get_wind_icon(ft, row.wind),
-                                        ft.Text(f"{row.wind}", size=14, color=TEXT_COLOR),
-                                    ],
-                                ),
-                                ft.Row(
-                                    spacing=4,
-                                    controls=[
-                                        _get_cloud_icon(ft, row.clouds),
-                                        ft.Text(f"{row.clouds}", size=13, color=TEXT_SECONDARY_COLOR),
-                                        ft.Container(width=4),
-                                        _get_rain_icon(ft, row.precipitation),
-                                        ft.Text(f"{row.precipitation}", size=13, color=TEXT_SECONDARY_COLOR),
-                                        ft.Container(width=4),
-                                        _get_humidity_icon(ft, row.humidity),
-                                        ft.Text(f"{row.humidity}", size=13, color=TEXT_SECONDARY_COLOR),
-                                    ],
-                                ),
-                            ],
-                        ),
-                        # Score badge
-                        ft.Column(
-                            horizontal_alignment=ft.CrossAxisAlignment.END,
-                            spacing=0,
-                            controls=[
-                                ft.Text(
-                                    f"{row.normalized_score}",
-                                    size=20,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=rating_color(row.rating),
-                                ),
-                                ft.Text(
-                                    row.rating,
-                                    size=11,
-                                    color=rating_color(row.rating),
-                                ),
-                            ],
-                        ),
-                    ],
-                ),
-            )
-            for row in rows
-        ]
+        hourly.controls = [recycled(hourly_rows, row, hourly_row) for row in rows]
         if not rows:
             hourly.controls = [ft.Text("No hourly forecast is available.")]
 
@@ -387,13 +402,20 @@ def create_mobile_app(
                 ft.Text("No ranked locations are available for this date.")
             ]
             return
-        ranking.controls = [ranking_row(card) for card in cards]
+        ranking.controls = [recycled(ranking_rows, card, ranking_row) for card in cards]
+
+    # Dropdown choices only change with the date or a reload, so an unchanged
+    # list keeps the options Flet already has instead of sending new ones.
+    shown_location_options: list[tuple[str, str]] = []
 
     def update_location_options() -> None:
+        nonlocal shown_location_options
         options = model.location_options()
-        location_dropdown.options = [
-            ft.DropdownOption(key=key, text=name) for key, name in options
-        ]
+        if options != shown_location_options:
+            shown_location_options = options
+            location_dropdown.options = [
+                ft.DropdownOption(key=key, text=name) for key, name in options
+            ]
         location_dropdown.disabled = not options
         location_dropdown.hint_text = "Choose a location"
         location_dropdown.value = model.selected_location_key or None
@@ -426,8 +448,10 @@ def create_mobile_app(
         date_dropdown.value = model.selected_date.isoformat() if model.selected_date else None
 
     def on_group_select(event: Any) -> None:
+        nonlocal shown_location_options
         model.select_group(event.control.value)
         update_date_options()
+        shown_location_options = []
         location_dropdown.options = []
         location_dropdown.value = None
         location_dropdown.disabled = True
@@ -458,6 +482,8 @@ def create_mobile_app(
 
         try:
             batch = await asyncio.to_thread(model.load)
+            ranking_rows.clear()
+            hourly_rows.clear()
             update_date_options()
             if batch.loaded_count:
                 status.value = f"Loaded {batch.loaded_count} locations"
@@ -9,12 +9,17 @@ from src.application.presentation import (
     format_percentage,
     format_precipitation,
     format_temperature,
+    format_time,
     format_wind_speed,
+    hourly_display_values,
 )
+from src.core.config import get_current_datetime
 from src.core.evaluation import (
     get_available_dates,
+    get_ranking_time_slot,
     get_time_blocks_for_date,
     get_top_locations_for_date,
+    has_time_blocks_for_date,
 )
 from src.core.locations import LOCATION_GROUPS
 from src.core.scoring import (
@@ -73,6 +78,7 @@ class MobileWeatherViewModel:
         self.selected_location_key = ""
         self.forecasts: dict[str, dict] = {}
         self.errors: dict[str, str] = {}
+        self._rankings: dict[tuple, list[dict]] = {}
 
     @property
     def locations(self):
@@ -100,6 +106,7 @@ class MobileWeatherViewModel:
         batch = self.service.load_locations(self.locations)
         self.forecasts = batch.forecasts
         self.errors = batch.errors
+        self._rankings = {}
         available_dates = self.available_dates()
         self.selected_date = (
             previous_date if previous_date in available_dates
@@ -134,7 +141,7 @@ class MobileWeatherViewModel:
             key
             for key, forecast in self.forecasts.items()
             if key in self.locations
-            and get_time_blocks_for_date(forecast, self.selected_date)
+            and has_time_blocks_for_date(forecast, self.selected_date)
         ]
 
     def location_options(self) -> list[tuple[str, str]]:
@@ -173,17 +180,33 @@ class MobileWeatherViewModel:
     def ranked_locations(self, top_n: int = 10) -> list[RankedLocationView]:
         if self.selected_date is None:
             return []
-        ranked = get_top_locations_for_date(
-            self.forecasts,
-            self.selected_date,
-            top_n=top_n,
-            activity_profile=self.activity_profile,
-        )
         return [
             self._ranked_location_view(index, item)
-            for index, item in enumerate(ranked, 1)
+            for index, item in enumerate(self._full_ranking()[:top_n], 1)
         ]
 
+    def _full_ranking(self) -> list[dict]:
+        """Rank every loaded location once per date, activity and half hour.
+
+        The Top 10, the selected-location summary and the default selection
+        all slice this one ranking instead of re-ranking the whole group.
+        Rankings from earlier half hours are dropped as a new one is made.
+        """
+        now = get_current_datetime()
+        time_slot = get_ranking_time_slot(now)
+        cache_key = (self.selected_date, self.activity_profile, time_slot)
+        if cache_key not in self._rankings:
+            for old_key in [key for key in self._rankings if key[-1] < time_slot]:
+                del self._rankings[old_key]
+            self._rankings[cache_key] = get_top_locations_for_date(
+                self.forecasts,
+                self.selected_date,
+                top_n=len(self.forecasts),
+                activity_profile=self.activity_profile,
+                now_local=now,
+            )
+        return self._rankings[cache_key]
+
     def hourly_forecast(self, location_key: str) -> list[HourlyForecastView]:
         if self.selected_date is None or location_key not in self.forecasts:
             return []
@@ -201,6 +224,7 @@ class MobileWeatherViewModel:
     def _clear_forecasts(self) -> None:
         self.forecasts = {}
         self.errors = {}
+        self._rankings = {}
         self.selected_date = None
         self.selected_location_key = ""
 
@@ -208,7 +232,7 @@ class MobileWeatherViewModel:
         raw_score = float(item["raw_score"])
         block = item["optimal_block"]
         end_time = block["end"] + timedelta(hours=1)
-        best_window = f"{block['start']:%H:%M} - {end_time:%H:%M}"
+        best_window = f"{format_time(block['start'])} - {format_time(end_time)}"
         return RankedLocationView(
             rank=rank,
             location_key=item["location_key"],
@@ -247,13 +271,14 @@ class MobileWeatherViewModel:
     def _hourly_forecast_view(self, hour) -> HourlyForecastView:
         raw_score = get_activity_score(hour, self.activity_profile)
         normalized = normalize_score(raw_score, self.activity_profile)
+        values = hour.display_values or hourly_display_values(hour)
         return HourlyForecastView(
-            time=f"{hour.time:%H:%M}",
-            temperature=format_temperature(hour.temp),
-            wind=format_wind_speed(hour.wind),
-            clouds=format_percentage(hour.cloud_coverage),
-            precipitation=format_precipitation(hour.precipitation_amount),
-            humidity=format_percentage(hour.relative_humidity),
+            time=values.time,
+            temperature=values.temperature,
+            wind=values.wind,
+            clouds=values.clouds,
+            precipitation=values.precipitation,
+            humidity=values.humidity,
             normalized_score=normalized,
             rating=get_rating_info(raw_score, self.activity_profile),
         )
@@ -110,8 +110,8 @@ def mock_app_dependencies():
          patch('src.gui.app.ttk') as mock_ttk, \
          patch('src.gui.app.messagebox') as mock_msgbox, \
          patch('src.gui.app.apply_theme'), \
-         patch('src.gui.app.fetch_weather_data'), \
-         patch('threading.Thread'):
+         patch('src.gui.app.fetch_weather_data_cached'), \
+         patch('src.gui.app.threading'):
 
         # Setup common mock behaviors
         mock_tk.Tk.return_value = MagicMock()
@@ -0,0 +1,133 @@
+"""
+Tests for the on-disk forecast cache.
+"""
+
+import os
+import time
+from datetime import date
+
+import pytest
+
+from src.core import cache
+from src.core.cache import (
+    get_cached,
+    get_cached_processed,
+    get_cached_validators,
+    prune_cache,
+    put_cached,
+    put_cached_processed,
+    touch_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_put_and_get_round_trip():
+    """Test that a stored payload is returned while fresh."""
+    payload = {"properties": {"timeseries": [{"time": "2024-03-15T10:00:00Z"}]}}
+
+    put_cached("gijon", payload)
+
+    assert get_cached("gijon") == payload
+
+
+def test_get_cached_missing_entry():
+    """Test that an unknown location is a cache miss."""
+    assert get_cached("nowhere") is None
+
+
+def test_get_cached_expired_entry(cache_dir):
+    """Test that entries older than the TTL are ignored."""
+    put_cached("gijon", {"properties": {}})
+    stale_time = time.time() - cache.CACHE_TTL_SECONDS - 1
+    os.utime(cache_dir / "gijon.json", (stale_time, stale_time))
+
+    assert get_cached("gijon") is None
+
+
+def test_get_cached_corrupt_entry(cache_dir):
+    """Test that unreadable cache files are treated as a miss."""
+    (cache_dir / "gijon.json").write_text("{not json", encoding="utf-8")
+
+    assert get_cached("gijon") is None
+
+
+def test_validators_are_stored_and_cleared_with_payload():
+    """Test that validators follow the payload they describe."""
+    validators = {"url": "https://example.test", "ETag": '"v1"'}
+
+    put_cached("gijon", {"properties": {}}, validators)
+    assert get_cached_validators("gijon") == validators
+
+    put_cached("gijon", {"properties": {}})
+    assert get_cached_validators("gijon") == {}
+
+
+def test_touch_cached_restarts_ttl(cache_dir):
+    """Test that touching a stale entry makes it fresh again."""
+    put_cached("gijon", {"properties": {}})
+    stale_time = time.time() - cache.CACHE_TTL_SECONDS - 1
+    os.utime(cache_dir / "gijon.json", (stale_time, stale_time))
+
+    touch_cached("gijon")
+
+    assert get_cached("gijon") == {"properties": {}}
+
+
+def test_processed_round_trip_for_same_payload():
+    """Test that processed data is reused for an identical payload and day."""
+    payload = {"properties": {"timeseries": []}}
+    processed = {"daily_forecasts": {date(2024, 3, 15): []}, "day_scores": {}}
+
+    put_cached_processed("gijon", payload, date(2024, 3, 15), processed)
+
+    assert get_cached_processed("gijon", payload, date(2024, 3, 15)) == processed
+
+
+def test_processed_cache_misses_on_new_payload_or_day():
+    """Test that a changed payload or a new day invalidates processed data."""
+    payload = {"properties": {"timeseries": []}}
+    put_cached_processed("gijon", payload, date(2024, 3, 15), {"day_scores": {}})
+
+    changed = {"properties": {"timeseries": [{"time": "2024-03-15T10:00:00Z"}]}}
+    assert get_cached_processed("gijon", changed, date(2024, 3, 15)) is None
+    assert get_cached_processed("gijon", payload, date(2024, 3, 16)) is None
+
+
+def test_stale_processed_snapshot_is_not_unpickled(monkeypatch):
+    """Test that a digest mismatch skips loading the stored forecast."""
+    payload = {"properties": {"timeseries": []}}
+    put_cached_processed("gijon", payload, date(2024, 3, 15), {"day_scores": {}})
+    loads = []
+    real_load = cache.pickle.load
+    monkeypatch.setattr(
+        cache.pickle, "load", lambda f: loads.append(1) or real_load(f)
+    )
+
+    assert get_cached_processed("gijon", payload, date(2024, 3, 16)) is None
+    assert len(loads) == 1
+
+
+def test_prune_removes_only_files_older_than_max_age(cache_dir):
+    """Test that pruning drops day-old entries and keeps recent ones."""
+    put_cached("old", {"properties": {}}, {"url": "https://example.test"})
+    put_cached("new", {"properties": {}})
+    day_ago = time.time() - 2 * cache.CACHE_MAX_AGE_SECONDS
+    for name in ("old.json", "old.meta.json"):
+        os.utime(cache_dir / name, (day_ago, day_ago))
+
+    prune_cache()
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["new.json"]
+
+
+def test_prune_tolerates_missing_cache_dir(cache_dir, monkeypatch):
+    """Test that pruning before the first download is a no-op."""
+    monkeypatch.setattr(cache, "CACHE_DIR", cache_dir / "missing")
+
+    prune_cache()
@@ -4,6 +4,7 @@ Consolidates tests for the core business logic of the weather helper.
 """
 
 from datetime import date, datetime, timedelta
+from unittest.mock import patch
 
 from src.core.config import (
     get_current_date,
@@ -11,13 +12,16 @@ from src.core.config import (
     get_timezone,
     safe_average,
 )
+from src.core import evaluation
 from src.core.evaluation import (
-    _calculate_weather_averages,
+    AVERAGED_HOUR_FIELDS,
+    _average_hour_fields,
     _create_hourly_weather,
     find_optimal_weather_block,
     get_available_dates,
     get_time_blocks_for_date,
     get_top_locations_for_date,
+    has_time_blocks_for_date,
     process_forecast,
 )
 from src.core.scoring import _get_value_from_ranges, normalize_score
@@ -122,6 +126,20 @@ def test_get_value_from_ranges():
     assert _get_value_from_ranges("invalid", ranges) is None  # type: ignore
 
 
+def test_get_value_from_ranges_open_ended_bounds():
+    ranges = [
+        ((None, 0), "below"),
+        ((0, 0), "exact"),
+        ((10, None), "above"),
+    ]
+
+    assert _get_value_from_ranges(-5, ranges) == "below"
+    assert _get_value_from_ranges(0, ranges, inclusive=True) == "below"
+    assert _get_value_from_ranges(0, ranges) is None
+    assert _get_value_from_ranges(1000, ranges) == "above"
+    assert _get_value_from_ranges(5, ranges) is None
+
+
 # Tests for other missing functions
 
 
@@ -177,30 +195,59 @@ def test_get_time_blocks_for_date():
     assert blocks[1].hour == 10
 
 
-def test_calculate_weather_averages(sample_hourly_weather):
+def test_forecast_timestamps_are_parsed_once_across_locations():
+    first = evaluation._parse_local_forecast_time("2030-06-15T10:00:00Z")
+    second = evaluation._parse_local_forecast_time("2030-06-15T10:00:00Z")
+
+    assert first is second
+    assert first.tzinfo is not None
+    assert first.utcoffset() == timedelta(hours=2)  # Madrid summer time
+
+
+def test_recommendation_hours_drop_past_hours_of_today(create_hour):
+    tz = get_timezone()
+    hours = [create_hour(datetime(2030, 6, 15, h, tzinfo=tz)) for h in range(8, 21)]
+
+    before_half = datetime(2030, 6, 15, 12, 10, tzinfo=tz)
+    after_half = datetime(2030, 6, 15, 12, 40, tzinfo=tz)
+    filtered = evaluation._filter_hours_for_recommendations
+
+    assert [h.hour for h in filtered(hours, date(2030, 6, 15), before_half)][:2] == [12, 13]
+    assert [h.hour for h in filtered(hours, date(2030, 6, 15), after_half)][:2] == [13, 14]
+    assert filtered(hours, date(2030, 6, 16), after_half) is hours
+    assert filtered(hours, date(2030, 6, 15), datetime(2030, 6, 15, 22, tzinfo=tz)) == []
+
+
+def test_has_time_blocks_for_date():
+    test_date = date(2024, 3, 15)
+    hour = HourlyWeather(time=datetime(2024, 3, 15, 10))
+
+    assert has_time_blocks_for_date({"daily_forecasts": {test_date: [hour]}}, test_date)
+    assert not has_time_blocks_for_date({"daily_forecasts": {test_date: []}}, test_date)
+    assert not has_time_blocks_for_date({"daily_forecasts": {}}, test_date)
+    assert not has_time_blocks_for_date({}, test_date)
+
+
+def test_average_hour_fields(sample_hourly_weather):
     # Test with empty list
-    avg_temp, avg_wind, avg_humidity, avg_precip = _calculate_weather_averages([])
-    assert avg_temp is None
-    assert avg_wind is None
-    assert avg_humidity is None
-    assert avg_precip is None
+    assert _average_hour_fields([]) == dict.fromkeys(AVERAGED_HOUR_FIELDS)
 
     # Test with hours that have None values
     hour1 = HourlyWeather(
         time=datetime(2024, 3, 15, 10), temp=None, wind=None, relative_humidity=None, precipitation_amount=None
     )
-    avg_temp, avg_wind, avg_humidity, avg_precip = _calculate_weather_averages([hour1])
-    assert avg_temp is None
-    assert avg_wind is None
-    assert avg_humidity is None
-    assert avg_precip is None
+    averages = _average_hour_fields([hour1])
+    assert averages["temp"] is None
+    assert averages["wind"] is None
+    assert averages["relative_humidity"] is None
+    assert averages["precipitation_amount"] is None
 
     # Test with fixture
-    avg_temp, avg_wind, avg_humidity, avg_precip = _calculate_weather_averages([sample_hourly_weather])
-    assert avg_temp == 20.0
-    assert avg_wind == 5.0
-    assert avg_humidity == 60.0
-    assert avg_precip == 0.0
+    averages = _average_hour_fields([sample_hourly_weather])
+    assert averages["temp"] == 20.0
+    assert averages["wind"] == 5.0
+    assert averages["relative_humidity"] == 60.0
+    assert averages["precipitation_amount"] == 0.0
 
     # Test with mixed valid and None data
     hour2 = HourlyWeather(
@@ -210,17 +257,15 @@ def test_calculate_weather_averages(sample_hourly_weather):
         time=datetime(2024, 3, 15, 12), temp=None, wind=7, relative_humidity=65, precipitation_amount=None
     )  # Mixed None values
 
-    avg_temp, avg_wind, avg_humidity, avg_precip = _calculate_weather_averages(
-        [sample_hourly_weather, hour2, hour3]
-    )
+    averages = _average_hour_fields([sample_hourly_weather, hour2, hour3])
     # (20 + 22) / 2 = 21.0
-    assert avg_temp == 21.0
+    assert averages["temp"] == 21.0
     # (5 + 3 + 7) / 3 = 5.0
-    assert avg_wind == 5.0
+    assert averages["wind"] == 5.0
     # (60 + 55 + 65) / 3 = 60.0
-    assert avg_humidity == 60.0
+    assert averages["relative_humidity"] == 60.0
     # (0.0 + 0.2) / 2 = 0.1
-    assert avg_precip == 0.1
+    assert averages["precipitation_amount"] == 0.1
 
 
 # Tests for the process_forecast function with more edge cases
@@ -394,6 +439,24 @@ def test_drastic_changes_reduce_day_score_more_than_consistent_weather(create_ho
     assert results["consistent"]["score"] > results["volatile"]["score"]
 
 
+def test_ranking_reuses_report_optimal_block_while_hours_are_unchanged(create_hour):
+    forecast_date = date(2030, 6, 15)
+    base_time = datetime(2030, 6, 15, 10)
+    hours = [create_hour(base_time + timedelta(hours=h), total_score=7) for h in range(5)]
+    all_locations = {"loc": _processed_location(forecast_date, hours, "Loc")}
+
+    with patch(
+        "src.core.evaluation._find_optimal_consistent_block",
+        wraps=evaluation._find_optimal_consistent_block,
+    ) as mock_find:
+        first = get_top_locations_for_date(all_locations, forecast_date)
+        second = get_top_locations_for_date(all_locations, forecast_date)
+        get_top_locations_for_date(all_locations, forecast_date, activity_profile="hiking")
+
+    assert first == second
+    assert mock_find.call_count == 2
+
+
 def _processed_location(
     forecast_date: date,
     hours: list[HourlyWeather],
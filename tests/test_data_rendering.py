@@ -71,12 +71,16 @@ def test_update_main_table_rendering(mock_app, create_hour):
     with patch('src.gui.app.get_time_blocks_for_date', return_value=[hw]):
         app._update_main_table()
 
-    # Verify insert was called
-    app.main_table.insert.assert_called()
+    # Verify the first pooled row was filled in place and attached
+    tk_call = app.main_table.tk.call
+    item_call, move_call = tk_call.call_args_list
+    assert move_call.args == (app.main_table, "move", app.table_row_ids[0], "", 0)
+    app.main_table.insert.assert_not_called()
 
-    # Verify values passed to insert
-    call_args = app.main_table.insert.call_args
-    values = call_args[1]['values']
+    # Verify values written to the row
+    _table, command, row_id, _values_opt, values, _tags_opt, tags = item_call.args
+    assert (command, row_id) == ("item", app.table_row_ids[0])
+    assert len(tags) == 1
 
     # Check format
     assert values[0] == "12:00"
@@ -111,3 +115,157 @@ def test_missing_precipitation_is_not_described_as_dry(mock_app):
     assert not mock_app._is_dry_block(
         {"precip": None, "precip_probability": 5}
     )
+
+
+def test_update_main_table_detaches_unused_pooled_rows(mock_app):
+    app = mock_app
+    app.selected_location_key = ""
+    app.selected_date = None
+
+    app._update_main_table()
+
+    detached = [call.args[0] for call in app.main_table.detach.call_args_list]
+    assert detached == app.table_row_ids
+    app.main_table.delete.assert_not_called()
+
+
+def test_side_panel_refresh_skips_unchanged_labels(mock_app):
+    app = mock_app
+    loc_data = {
+        "location_key": "gijon",
+        "location_name": "Gijón",
+        "raw_score": 12.0,
+        "optimal_block": None,
+    }
+    labels = app.side_panel_entries[0]
+
+    app._populate_side_panel_entries([loc_data])
+    for label in labels:
+        label.config.reset_mock()
+    app._populate_side_panel_entries([loc_data])
+
+    for label in labels:
+        label.config.assert_not_called()
+        label.configure.assert_called_once_with(cursor="hand2")
+        label.bind.assert_not_called()
+
+
+def test_side_panel_row_click_selects_row_location(mock_app):
+    app = mock_app
+    app._select_side_panel_location = MagicMock()
+    app._set_side_panel_row_key(0, "gijon")
+
+    app._on_side_panel_row_click(0)
+    app._on_side_panel_row_click(1)
+
+    app._select_side_panel_location.assert_called_once_with("gijon")
+
+
+def test_main_table_reuses_scored_hours_until_data_changes(mock_app, create_hour):
+    app = mock_app
+    app.selected_location_key = "test_loc"
+    app.selected_date = date(2023, 1, 1)
+    hour = create_hour(time=datetime(2023, 1, 1, 12, 0), total_score=20)
+    app.all_location_processed = {"test_loc": {"daily_forecasts": {}}}
+
+    with patch('src.gui.app.get_time_blocks_for_date', return_value=[hour]) as mock_blocks:
+        app._update_main_table()
+        app.show_scores.get.return_value = False
+        app._update_main_table()
+        assert mock_blocks.call_count == 1
+
+        app._on_loading_complete(app.load_generation, {}, {})
+        app.all_location_processed = {"test_loc": {"daily_forecasts": {}}}
+        app._update_main_table()
+        assert mock_blocks.call_count == 2
+
+
+def test_main_table_reads_score_toggle_once_per_refresh(mock_app, create_hour):
+    app = mock_app
+    app.selected_location_key = "test_loc"
+    app.selected_date = date(2023, 1, 1)
+    hours = [create_hour(time=datetime(2023, 1, 1, h, 0), total_score=20) for h in (9, 10, 11)]
+    app.all_location_processed = {"test_loc": {"daily_forecasts": {}}}
+    app.show_scores.get.reset_mock()
+
+    with patch('src.gui.app.get_time_blocks_for_date', return_value=hours):
+        app._update_main_table()
+
+    app.show_scores.get.assert_called_once_with()
+    moves = [call for call in app.main_table.tk.call.call_args_list if call.args[1] == "move"]
+    assert len(moves) == 3
+
+
+def test_profile_score_column_follows_score_toggle(mock_app):
+    app = mock_app
+    app.selected_activity_profile = "hiking"
+
+    assert app._profile_score_formatter(False)(13, "Very Good") == "80/100"
+    assert app._profile_score_formatter(True)(13, "Very Good") == "80/100 (13.0, Very Good)"
+
+
+def test_location_score_style_is_reused_across_refreshes(mock_app):
+    app = mock_app
+    app.show_scores.get.return_value = False
+    loc_data = {"raw_score": 11.2468, "activity_profile": "hiking"}
+
+    with patch('src.gui.app.get_rating_info', return_value="Good") as mock_rating:
+        first = app._format_location_score(loc_data)
+        second = app._format_location_score(loc_data)
+
+    assert first == second
+    assert first[0].endswith("(Good)")
+    mock_rating.assert_called_once()
+
+
+def test_location_score_style_is_reset_when_forecasts_load(mock_app):
+    app = mock_app
+    app.show_scores.get.return_value = False
+    loc_data = {"raw_score": 11.2468, "activity_profile": "hiking"}
+
+    with patch('src.gui.app.get_rating_info', return_value="Poor"):
+        assert app._format_location_score(loc_data)[0].endswith("(Poor)")
+    app._set_loaded_forecasts({})
+
+    assert app._format_location_score(loc_data)[0].endswith("(Good)")
+
+
+def test_unchanged_table_rows_are_not_rewritten(mock_app, create_hour):
+    app = mock_app
+    app.selected_location_key = "test_loc"
+    app.selected_date = date(2023, 1, 1)
+    hours = [create_hour(time=datetime(2023, 1, 1, h, 0), total_score=20) for h in (9, 10)]
+    app.all_location_processed = {"test_loc": {"daily_forecasts": {}}}
+    app.show_scores.get.return_value = False
+    tk_call = app.main_table.tk.call
+
+    with patch('src.gui.app.get_time_blocks_for_date', return_value=hours):
+        app._update_main_table()
+        tk_call.reset_mock()
+        app._update_main_table()
+        tk_call.assert_not_called()
+
+        app.show_scores.get.return_value = True
+        app._update_main_table()
+
+    assert [call.args[1] for call in tk_call.call_args_list] == ["item", "item"]
+
+
+def test_score_toggle_does_not_reformat_cached_hours(mock_app, create_hour):
+    app = mock_app
+    app.selected_location_key = "test_loc"
+    app.selected_date = date(2023, 1, 1)
+    hours = [create_hour(time=datetime(2023, 1, 1, h, 0), total_score=20) for h in (9, 10)]
+    app.all_location_processed = {"test_loc": {"daily_forecasts": {}}}
+    app.show_scores.get.return_value = False
+
+    with patch('src.gui.app.get_time_blocks_for_date', return_value=hours):
+        app._update_main_table()
+        with patch('src.gui.app.normalize_score') as mock_normalize:
+            app.show_scores.get.return_value = True
+            app._update_main_table()
+
+    mock_normalize.assert_not_called()
+    _table, command, _row_id, _values_opt, values, *_tags = app.main_table.tk.call.call_args.args
+    assert command == "item"
+    assert values[-1].endswith(")")
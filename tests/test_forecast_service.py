@@ -1,5 +1,10 @@
+import threading
+from datetime import date, datetime
+from unittest.mock import patch
+
 from src.application.forecast_service import (
     DOWNLOAD_ERROR,
+    MAX_CONCURRENT_LOADS,
     UNEXPECTED_ERROR,
     ForecastService,
 )
@@ -44,7 +49,28 @@ def test_load_locations_keeps_partial_success_and_reports_progress():
     assert batch.forecasts == {"good": {"name": "Good"}}
     assert batch.errors == {"bad": DOWNLOAD_ERROR}
     assert batch.loaded_count == 1
-    assert progress == [(1, 2, "good"), (2, 2, "bad")]
+    assert [(current, total) for current, total, _key in progress] == [(1, 2), (2, 2)]
+    assert sorted(key for _current, _total, key in progress) == ["bad", "good"]
+
+
+def test_load_locations_fetches_concurrently_and_keeps_group_order():
+    locations = {
+        key: Location(key, key.title(), 1.0, 2.0) for key in ("slow", "fast")
+    }
+    fast_done = threading.Event()
+
+    def fetch(location):
+        if location.key == "slow":
+            assert fast_done.wait(timeout=5), "locations were fetched one at a time"
+        else:
+            fast_done.set()
+        return {}
+
+    service = ForecastService(fetch_forecast=fetch, process=lambda payload, name: {"name": name})
+
+    batch = service.load_locations(locations)
+
+    assert list(batch.forecasts) == ["slow", "fast"]
 
 
 def test_load_location_converts_dependency_exception_to_error():
@@ -58,3 +84,55 @@ def test_load_location_converts_dependency_exception_to_error():
     assert not result.succeeded
     assert result.error == UNEXPECTED_ERROR
     assert "network unavailable" not in result.error
+
+
+def test_load_location_reuses_cached_processed_forecast():
+    location = Location("test", "Test", 1.0, 2.0)
+    cached = {"daily_forecasts": {}, "day_scores": {}}
+    processed_calls = []
+    service = ForecastService(
+        fetch_forecast=lambda requested: {"properties": {"timeseries": []}},
+        process=lambda payload, name: processed_calls.append(name),
+        cache_processed=True,
+    )
+
+    with patch(
+        "src.application.forecast_service.get_cached_processed",
+        return_value=cached,
+    ):
+        result = service.load_location(location)
+
+    assert result.forecast == cached
+    assert processed_calls == []
+
+
+def test_load_location_precomputes_hourly_display_values(create_hour):
+    location = Location("test", "Test", 1.0, 2.0)
+    hour = create_hour(datetime(2024, 3, 15, 12), temp=21.0, wind=3.0)
+    service = ForecastService(
+        fetch_forecast=lambda requested: {},
+        process=lambda payload, name: {"daily_forecasts": {date(2024, 3, 15): [hour]}},
+    )
+
+    service.load_location(location)
+
+    assert hour.display_values.time == "12:00"
+    assert hour.display_values.temperature == "21.0°C"
+    assert hour.display_values.wind == "3.0 m/s"
+
+
+def test_default_fetch_reuses_one_pooled_session():
+    location = Location("test", "Test", 1.0, 2.0)
+
+    with patch(
+        "src.application.forecast_service.fetch_weather_data", return_value=None
+    ) as mock_fetch, patch(
+        "src.application.forecast_service.create_session"
+    ) as mock_create_session:
+        service = ForecastService()
+        service.load_location(location)
+        service.load_location(location)
+
+    mock_create_session.assert_called_once_with(pool_maxsize=MAX_CONCURRENT_LOADS)
+    sessions = [call.kwargs["session"] for call in mock_fetch.call_args_list]
+    assert sessions == [mock_create_session.return_value] * 2
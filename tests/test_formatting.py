@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.gui.formatting import (
+    TOOLTIP_DELAY_MS,
     ToolTip,
     add_tooltip,
     format_date,
@@ -179,8 +180,8 @@ class TestToolTipAdvanced:
             mock_lbl = MagicMock()
             mock_label.return_value = mock_lbl
 
-            # Test on_enter
-            tooltip.on_enter()
+            # Test show
+            tooltip.show()
 
             # Verify Toplevel was created with correct position
             mock_toplevel.assert_called_once_with(mock_widget)
@@ -212,40 +213,64 @@ class TestToolTipAdvanced:
             mock_top = MagicMock()
             mock_toplevel.return_value = mock_top
 
-            # Test on_enter
-            tooltip.on_enter()
+            # Test show
+            tooltip.show()
 
             # Should use default bbox values (0, 0, 0, 0)
             mock_top.wm_geometry.assert_called_once_with(
                 "+120+220"
             )  # 100+0+20, 200+0+20
 
-    def test_tooltip_on_enter_already_exists(self, mock_widget):
-        """Test tooltip on_enter when tooltip window already exists."""
+    def test_tooltip_on_enter_already_visible(self, mock_widget):
+        """Test tooltip on_enter when the tooltip is already showing."""
         tooltip = ToolTip(mock_widget, "Test tooltip")
         tooltip.tooltip_window = MagicMock()  # Simulate existing tooltip
+        tooltip.visible = True
 
         with patch("tkinter.Toplevel") as mock_toplevel:
-            # Test on_enter - should return early
-            tooltip.on_enter()
+            # Test show - should return early
+            tooltip.show()
 
             # Toplevel should not be called since tooltip already exists
             mock_toplevel.assert_not_called()
+            tooltip.tooltip_window.deiconify.assert_not_called()
 
-    def test_tooltip_on_leave_destroys_window(self, mock_widget):
-        """Test tooltip on_leave destroys the tooltip window."""
+    def test_tooltip_on_leave_hides_window(self, mock_widget):
+        """Test tooltip on_leave hides but keeps the tooltip window."""
         tooltip = ToolTip(mock_widget, "Test tooltip")
 
         # Create a mock tooltip window
         mock_window = MagicMock()
         tooltip.tooltip_window = mock_window
+        tooltip.visible = True
 
         # Test on_leave
         tooltip.on_leave()
 
-        # Verify window was destroyed and reference cleared
-        mock_window.destroy.assert_called_once()
-        assert tooltip.tooltip_window is None
+        # Verify window was hidden, not destroyed
+        mock_window.withdraw.assert_called_once()
+        mock_window.destroy.assert_not_called()
+        assert tooltip.tooltip_window is mock_window
+        assert not tooltip.visible
+
+    def test_tooltip_window_is_reused_on_next_hover(self, mock_widget):
+        """Test a second hover shows the same window with current text."""
+        tooltip = ToolTip(mock_widget, "Test tooltip")
+
+        with (
+            patch("tkinter.Toplevel") as mock_toplevel,
+            patch("tkinter.Label") as mock_label,
+        ):
+            tooltip.show()
+            tooltip.on_leave()
+            tooltip.text = "Updated tooltip"
+            tooltip.show()
+
+        mock_toplevel.assert_called_once()
+        mock_label.assert_called_once()
+        mock_label.return_value.configure.assert_called_once_with(text="Updated tooltip")
+        mock_toplevel.return_value.deiconify.assert_called_once_with()
+        assert tooltip.visible
 
     def test_tooltip_hasattr_check(self, mock_widget):
         """Test the hasattr check for bbox method."""
@@ -257,3 +282,31 @@ class TestToolTipAdvanced:
         # Remove bbox and test
         del mock_widget.bbox
         assert not hasattr(mock_widget, "bbox")
+
+
+class TestToolTipDelay:
+    """Tests for the hover delay before a tooltip appears."""
+
+    def test_enter_schedules_show_instead_of_showing(self):
+        widget = MagicMock()
+        tooltip = ToolTip(widget, "Test tooltip")
+
+        with patch("tkinter.Toplevel") as mock_toplevel:
+            tooltip.on_enter()
+            tooltip.on_enter()
+
+        widget.after.assert_called_once_with(TOOLTIP_DELAY_MS, tooltip.show)
+        assert tooltip.pending_show is widget.after.return_value
+        mock_toplevel.assert_not_called()
+
+    def test_leave_before_delay_cancels_show(self):
+        widget = MagicMock()
+        tooltip = ToolTip(widget, "Test tooltip")
+
+        with patch("tkinter.Toplevel") as mock_toplevel:
+            tooltip.on_enter()
+            tooltip.on_leave()
+
+        widget.after_cancel.assert_called_once_with(widget.after.return_value)
+        assert tooltip.pending_show is None
+        mock_toplevel.assert_not_called()
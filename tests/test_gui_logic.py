@@ -1,7 +1,10 @@
+from datetime import date
+
 import pytest
-from unittest.mock import MagicMock
-from src.application.forecast_service import LocationForecastResult
+from unittest.mock import MagicMock, patch
+from src.application.forecast_service import UNEXPECTED_ERROR, LocationForecastResult
 from src.gui.app import WeatherHelperApp
+from src.core.config import get_current_datetime
 from src.core.locations import LOCATION_GROUPS
 
 pytestmark = pytest.mark.windows_gui
@@ -72,11 +75,34 @@ def test_stale_worker_cannot_write_results_into_new_region(mock_app):
 
     assert app.all_location_processed == {}
     assert app.loaded_locations == set()
-    assert app.root.after.call_count == 1  # queued progress only, no completion
-    app.root.after.call_args.args[1]()
+    app.root.after.assert_not_called()  # no progress or completion for a stale load
     app.progress_var.set.assert_not_called()
 
 
+def test_concurrent_load_collects_every_location_once(mock_app):
+    """All locations are fetched and reported in a single completion callback."""
+    app = mock_app
+    app.load_generation = 1
+    app.root.after.reset_mock()
+    locations = {
+        key: MagicMock(name=key) for key in ("gijon", "oviedo", "llanes", "bad")
+    }
+
+    def load(location):
+        if location is locations["bad"]:
+            return LocationForecastResult(location=location, error="offline")
+        return LocationForecastResult(location=location, forecast={"ok": True})
+
+    app.forecast_service.load_location = load
+    app._load_all_forecasts_threaded(1, locations)
+
+    _delay, completion, *completion_args = app.root.after.call_args_list[-1].args
+    assert completion == app._on_loading_complete
+    completion(*completion_args)
+    assert app.loaded_locations == {"gijon", "oviedo", "llanes"}
+    assert app.loading_errors == {"bad": "offline"}
+
+
 def test_stale_completion_payload_is_ignored(mock_app):
     app = mock_app
     app.load_generation = 3
@@ -85,3 +111,376 @@ def test_stale_completion_payload_is_ignored(mock_app):
 
     assert app.all_location_processed == {}
     assert app.loading_errors == {}
+
+
+def test_progress_updates_are_coalesced(mock_app):
+    """Fast loads queue one progress update per interval, not one per location."""
+    app = mock_app
+    app.load_generation = 1
+    app.root.after.reset_mock()
+    locations = {key: MagicMock(name=key) for key in ("gijon", "oviedo", "llanes")}
+    app.forecast_service.load_location = lambda location: LocationForecastResult(
+        location=location, forecast={"ok": True}
+    )
+
+    with patch("src.gui.app.time.monotonic", return_value=10.0):
+        app._load_all_forecasts_threaded(1, locations)
+
+    callbacks = [call.args[1] for call in app.root.after.call_args_list]
+    assert callbacks == [app._show_loading_progress, app._on_loading_complete]
+
+
+def test_pending_progress_repaint_shows_latest_value(mock_app):
+    """Progress queued while the UI is busy is applied once, newest first."""
+    app = mock_app
+    app.load_generation = 1
+    app.root.after.reset_mock()
+
+    for loaded in (1, 2, 3):
+        app._queue_location_loading_status(1, f"loc{loaded}", loaded, 4, {})
+
+    app.root.after.assert_called_once_with(0, app._show_loading_progress)
+    app._show_loading_progress()
+    app.progress_var.set.assert_called_once_with(75.0)
+    app._queue_location_loading_status(1, "loc4", 4, 4, {})
+    assert app.root.after.call_count == 2
+
+
+def test_locations_are_offered_while_the_rest_still_load(mock_app):
+    """Partial results fill the selector without moving an existing choice."""
+    app = mock_app
+    app.load_generation = 1
+    app.location_var.get.return_value = ""
+
+    with patch.object(app, "on_location_change") as mock_change:
+        app._queue_location_loading_status(1, "Oviedo", 1, 3, {"oviedo": {}})
+        app._show_loading_progress()
+        app.location_var.set.assert_called_once_with("Oviedo")
+        assert mock_change.call_count == 1
+
+        app.location_var.get.return_value = "Oviedo"
+        app._queue_location_loading_status(1, "Gijón", 2, 3, {"oviedo": {}, "gijon": {}})
+        app._show_loading_progress()
+
+    assert app.location_dropdown.__setitem__.call_args.args == ("values", ("Gijón", "Oviedo"))
+    app.location_var.set.assert_called_once_with("Oviedo")
+    assert mock_change.call_count == 1
+    assert app.loaded_locations == {"oviedo", "gijon"}
+
+
+def test_side_panel_ranking_is_reused_until_data_changes(mock_app):
+    """Repeated refreshes for the same date and activity rank only once."""
+    app = mock_app
+    app.selected_date = date(2024, 3, 15)
+
+    with patch("src.gui.app.get_top_locations_for_date", return_value=[]) as mock_rank:
+        app._top_locations_for_selected_date()
+        app._top_locations_for_selected_date()
+        assert mock_rank.call_count == 1
+
+        app._on_loading_complete(app.load_generation, {}, {})
+        app._top_locations_for_selected_date()
+        assert mock_rank.call_count == 2
+
+
+def test_rapid_display_updates_are_debounced(mock_app):
+    """Only the last of several quick selector changes repaints the panels."""
+    app = mock_app
+    app.root.after.side_effect = ["first", "second"]
+
+    app._update_displays()
+    app._update_displays()
+
+    app.root.after_cancel.assert_called_once_with("first")
+    assert app._pending_display_refresh == "second"
+    assert app.root.after.call_args.args[1] == app._refresh_displays
+
+
+def test_refresh_is_skipped_when_selection_is_unchanged(mock_app):
+    """Reselecting the same location and date does not repaint the panels."""
+    app = mock_app
+    app.selected_location_key = "loc1"
+    app.selected_date = date(2024, 3, 15)
+
+    with patch.object(app, "_update_side_panel") as mock_side_panel, \
+            patch.object(app, "_update_main_table"):
+        app._refresh_displays()
+        app._refresh_displays()
+        assert mock_side_panel.call_count == 1
+
+        app._on_loading_complete(app.load_generation, {}, {})
+        app._refresh_displays()
+        assert mock_side_panel.call_count == 2
+
+
+def test_refresh_waits_until_hidden_window_is_mapped(mock_app):
+    """A minimized window defers its repaint until it is shown again."""
+    app = mock_app
+    app.root.winfo_viewable.return_value = 0
+
+    with patch.object(app, "_update_side_panel") as mock_side_panel, \
+            patch.object(app, "_update_main_table"), \
+            patch.object(app, "_update_displays") as mock_update:
+        app._refresh_displays()
+        mock_side_panel.assert_not_called()
+
+        app._on_window_mapped(MagicMock(widget=app.main_table))
+        mock_update.assert_not_called()
+        app._on_window_mapped(MagicMock(widget=app.root))
+        app._on_window_mapped(MagicMock(widget=app.root))
+        mock_update.assert_called_once_with()
+
+
+def test_location_name_lookup_follows_group_switch(mock_app):
+    app = mock_app
+    assert app._location_key_for_name("Gijón") == "gijon"
+
+    app.group_var.get.return_value = "Spain"
+    app.on_group_change()
+
+    assert app._location_key_for_name("Málaga") == "malaga"
+    assert app._location_key_for_name("Gijón") == ""
+
+
+def test_loaded_location_names_keep_alphabetical_order(mock_app):
+    app = mock_app
+    app.loaded_locations = {"oviedo", "gijon"}
+
+    assert app._loaded_location_names() == ("Gijón", "Oviedo")
+
+
+def test_precompute_ranks_every_loaded_date(mock_app):
+    app = mock_app
+    days = [date(2024, 3, 15), date(2024, 3, 16)]
+    app.all_location_processed = {"gijon": {"daily_forecasts": {d: [] for d in days}}}
+    cache = app._top_locations_cache
+
+    with patch("src.gui.app.get_top_locations_for_date", return_value=[]) as mock_rank:
+        app._precompute_top_locations(
+            app.load_generation, app.all_location_processed, cache, app.selected_activity_profile
+        )
+
+    assert [call.args[1] for call in mock_rank.call_args_list] == days
+    assert all(call.kwargs["cache_blocks"] is False for call in mock_rank.call_args_list)
+    assert cache == {}
+    _, store, *args = app.root.after.call_args.args
+    store(*args)
+    app.selected_date = days[1]
+    with patch("src.gui.app.get_top_locations_for_date") as mock_rank:
+        assert app._top_locations_for_selected_date() == []
+    mock_rank.assert_not_called()
+
+
+def test_precompute_ranks_every_date_against_one_clock_reading(mock_app):
+    app = mock_app
+    days = [date(2024, 3, 15), date(2024, 3, 16), date(2024, 3, 17)]
+    forecasts = {"gijon": {"daily_forecasts": {d: [] for d in days}}}
+
+    with patch("src.gui.app.get_top_locations_for_date", return_value=[]) as mock_rank, \
+            patch("src.gui.app.get_current_datetime", wraps=get_current_datetime) as mock_now:
+        app._precompute_top_locations(
+            app.load_generation, forecasts, app._top_locations_cache, app.selected_activity_profile
+        )
+
+    mock_now.assert_called_once_with()
+    now_values = {call.kwargs["now_local"] for call in mock_rank.call_args_list}
+    assert len(mock_rank.call_args_list) == 3
+    assert len(now_values) == 1
+
+
+def test_precompute_stops_when_cache_is_replaced(mock_app):
+    app = mock_app
+    forecasts = {"gijon": {"daily_forecasts": {date(2024, 3, 15): []}}}
+    stale_cache = {}
+
+    with patch("src.gui.app.get_top_locations_for_date") as mock_rank:
+        app._precompute_top_locations(
+            app.load_generation, forecasts, stale_cache, app.selected_activity_profile
+        )
+
+    mock_rank.assert_not_called()
+    assert stale_cache == {}
+
+
+def test_precomputed_rankings_from_a_stale_load_are_dropped(mock_app):
+    app = mock_app
+    cache = app._top_locations_cache
+    generation_id = app.load_generation
+    app.load_generation += 1
+
+    app._store_precomputed_top_locations(generation_id, cache, {("key",): []})
+
+    assert cache == {}
+
+
+def test_switching_back_to_loaded_group_skips_reload(mock_app):
+    app = mock_app
+    app._on_loading_complete(app.load_generation, {"gijon": {}}, {})
+
+    app.group_var.get.return_value = "Spain"
+    app.on_group_change()
+    spain_generation = app.load_generation
+    app.group_var.get.return_value = "Asturias"
+    with patch.object(app, "_start_data_loading") as mock_start:
+        app.on_group_change()
+
+    mock_start.assert_not_called()
+    assert app.load_generation == spain_generation + 1
+    assert app.loaded_locations == {"gijon"}
+
+
+def test_expired_group_forecasts_are_reloaded(mock_app):
+    app = mock_app
+    app._group_forecasts["Spain"] = (-1e9, {"madrid": {}}, {})
+
+    app.group_var.get.return_value = "Spain"
+    with patch.object(app, "_start_data_loading") as mock_start:
+        app.on_group_change()
+
+    mock_start.assert_called_once_with()
+    assert "Spain" not in app._group_forecasts
+
+
+def test_previous_date_is_restored_when_still_available(mock_app):
+    app = mock_app
+    app._set_available_dates([date(2024, 3, 15), date(2024, 3, 16)])
+
+    app._restore_previous_date(date(2024, 3, 16))
+
+    assert app.selected_date == date(2024, 3, 16)
+    app._restore_previous_date(date(2024, 3, 20))
+    assert app.selected_date == date(2024, 3, 16)
+
+
+def test_loads_are_queued_for_one_long_lived_loader(mock_app):
+    app = mock_app
+    app._loader_thread = None
+
+    with patch("src.gui.app.threading") as mock_threading:
+        app._start_data_loading()
+        app._start_data_loading()
+
+    mock_threading.Thread.assert_called_once_with(target=app._loader_loop, daemon=True)
+    queued = [app._load_requests.get_nowait() for _ in range(2)]
+    assert [generation for generation, _locations in queued] == [
+        app.load_generation - 1,
+        app.load_generation,
+    ]
+
+
+def test_loader_skips_requests_superseded_by_newer_loads(mock_app):
+    app = mock_app
+    app.load_generation = 2
+    app._load_requests = MagicMock()
+    app._load_requests.get.side_effect = [(1, {"old": None}), (2, {"new": None}), SystemExit]
+
+    with patch.object(app, "_load_all_forecasts_threaded") as mock_load:
+        with pytest.raises(SystemExit):
+            app._loader_loop()
+
+    mock_load.assert_called_once_with(2, {"new": None})
+
+
+def test_location_change_schedules_a_single_refresh(mock_app):
+    app = mock_app
+    app.location_var.get.return_value = "Gijón"
+    app._location_keys_by_name = {"Gijón": "gijon"}
+    app.all_location_processed = {"gijon": {"daily_forecasts": {date(2024, 3, 15): []}}}
+    app.root.after.reset_mock()
+
+    app.on_location_change()
+
+    refreshes = [
+        call for call in app.root.after.call_args_list
+        if call.args[1] == app._refresh_displays
+    ]
+    assert len(refreshes) == 1
+    app.root.after_cancel.assert_not_called()
+
+
+def test_unchanged_date_choices_are_not_resent_to_tk(mock_app):
+    """Switching between locations with the same dates keeps the dropdown values."""
+    app = mock_app
+    dates = [date(2024, 3, 15), date(2024, 3, 16)]
+    app.date_dropdown.__setitem__.reset_mock()
+
+    with patch.object(app, "on_date_change"):
+        app._set_available_dates(dates)
+        app._set_available_dates(dates)
+
+    app.date_dropdown.__setitem__.assert_called_once()
+    assert app.date_dropdown.__setitem__.call_args.args == ("values", tuple(app.date_map))
+
+
+def test_refresh_reads_the_clock_once(mock_app):
+    """The render key and the side panel ranking share one current time."""
+    app = mock_app
+    app.selected_location_key = "loc1"
+    app.selected_date = date(2024, 3, 15)
+    now = get_current_datetime()
+
+    with patch("src.gui.app.get_current_datetime", return_value=now) as mock_now, \
+            patch("src.gui.app.get_top_locations_for_date", return_value=[]) as mock_rank, \
+            patch.object(app, "_update_main_table"):
+        app._refresh_displays()
+
+    mock_now.assert_called_once_with()
+    assert mock_rank.call_args.kwargs["now_local"] is now
+
+
+def test_loader_survives_a_failed_load(mock_app):
+    """A load that raises is reported as finished and the next queued load still runs."""
+    app = mock_app
+    app._load_requests.put((1, {"loc1": {}}))
+    app._load_requests.put((2, {"loc1": {}}))
+    completed = []
+
+    def fake_load(generation_id, locations):
+        if generation_id == 1:
+            raise RuntimeError("main thread is not in main loop")
+        completed.append(generation_id)
+        raise SystemExit  # stop the otherwise endless loader loop
+
+    with patch.object(app, "_load_all_forecasts_threaded", side_effect=fake_load), \
+            patch.object(app, "_is_stale_generation", return_value=False), \
+            patch("src.gui.app.prune_cache") as mock_prune:
+        with pytest.raises(SystemExit):
+            app._loader_loop()
+
+    mock_prune.assert_called_once_with()
+
+    assert completed == [2]
+    app.root.after.assert_any_call(0, app._on_loading_complete, 1, None, {"loc1": UNEXPECTED_ERROR})
+
+
+def test_closing_the_window_releases_fetch_resources(mock_app):
+    """Closing the window cancels queued fetches and closes the HTTP session."""
+    app = mock_app
+    app.load_generation = 3
+
+    with patch.object(app, "_fetch_executor") as mock_executor, \
+            patch.object(app, "_http_session") as mock_session:
+        app._on_close()
+
+    assert app._is_stale_generation(3)
+    mock_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    mock_session.close.assert_called_once_with()
+    app.root.destroy.assert_called_once_with()
+
+
+def test_rankings_from_earlier_half_hours_are_evicted(mock_app):
+    app = mock_app
+    app.selected_date = date(2024, 3, 16)
+    earlier = get_current_datetime().replace(year=2024, month=3, day=15, hour=9, minute=0)
+    later = earlier.replace(minute=45)
+
+    with patch("src.gui.app.get_top_locations_for_date", return_value=[]):
+        app._top_locations_for_selected_date(earlier)
+        app.selected_date = date(2024, 3, 17)
+        app._top_locations_for_selected_date(earlier)
+        assert len(app._top_locations_cache) == 2
+        app._top_locations_for_selected_date(later)
+
+    assert list(app._top_locations_cache) == [
+        app._top_locations_cache_key(date(2024, 3, 17), app.selected_activity_profile, later)
+    ]
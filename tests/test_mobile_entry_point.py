@@ -1,6 +1,79 @@
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.mobile import app
+from src.mobile.view_model import HourlyForecastView, RankedLocationView
+
+
+def _ranked_view(rank, location_key, normalized_score):
+    return RankedLocationView(
+        rank=rank,
+        location_key=location_key,
+        location_name=location_key.title(),
+        normalized_score=normalized_score,
+        raw_score=float(normalized_score),
+        rating="Good",
+        weather_description="Sunny",
+        best_window="10:00 - 13:00",
+        best_window_details="Warm and dry",
+    )
+
+
+def _stub_flet():
+    """Return a Flet stub whose containers, columns and dropdowns are distinct."""
+    ft = MagicMock()
+    built = {name: [] for name in ("Column", "Container", "Dropdown")}
+
+    def constructor(name):
+        def build(*args, **kwargs):
+            control = MagicMock()
+            control.controls = kwargs.get("controls", [])
+            built[name].append(control)
+            return control
+        return build
+
+    for name in built:
+        getattr(ft, name).side_effect = constructor(name)
+    return ft, built
+
+
+def test_mobile_rows_are_recycled_until_forecasts_reload():
+    gijon = _ranked_view(1, "gijon", 90)
+    oviedo = _ranked_view(2, "oviedo", 70)
+    noon = HourlyForecastView("12:00", "24 °C", "2 m/s", "20%", "0.0 mm", "60%", 90, "Good")
+    model = MagicMock(group_name="Asturias", activity_profile="hiking", selected_date=None)
+    model.load.return_value = SimpleNamespace(loaded_count=2, errors={})
+    model.available_dates.return_value = []
+    model.location_options.return_value = []
+    model.ranked_locations.return_value = [gijon, oviedo]
+    model.selected_location.return_value = gijon
+    model.hourly_forecast.return_value = [noon]
+    page = MagicMock()
+    ft, built = _stub_flet()
+
+    app.create_mobile_app(page, ft=ft, view_model=model)
+    ranking, _, hourly = built["Column"][:3]
+    profile_dropdown = built["Dropdown"][2]
+    refresh_forecast = page.run_task.call_args.args[0]
+    asyncio.run(refresh_forecast())
+    first_ranking = list(ranking.controls)
+    first_hourly = list(hourly.controls)
+
+    model.ranked_locations.return_value = [gijon, replace(oviedo, normalized_score=60)]
+    profile_dropdown.on_select(SimpleNamespace(control=SimpleNamespace(value="hiking")))
+
+    assert ranking.controls[0] is first_ranking[0]
+    assert ranking.controls[1] is not first_ranking[1]
+    assert hourly.controls[0] is first_hourly[0]
+
+    asyncio.run(refresh_forecast())
+
+    assert ranking.controls[0] is not first_ranking[0]
+    assert hourly.controls[0] is not first_hourly[0]
 
 
 def test_missing_flet_has_actionable_install_message(monkeypatch):
@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
 from src.application.forecast_service import ForecastBatch
-from src.core.config import get_current_date
+from src.core.config import get_current_date, get_current_datetime
+from src.core.evaluation import get_ranking_time_slot, get_top_locations_for_date
 from src.core.models import DailyReport, HourlyWeather
 from src.core.scoring import ACTIVITY_BEACH_DAY
 from src.mobile.view_model import MobileWeatherViewModel
@@ -188,3 +190,51 @@ def test_invalid_mobile_selections_fail_clearly():
 
     with pytest.raises(ValueError, match="Location is not available"):
         model.select_location("nowhere")
+
+
+def test_rankings_are_computed_once_per_load_and_selection():
+    forecast_date = get_current_date() + timedelta(days=1)
+    batch = ForecastBatch(
+        forecasts={
+            "gijon": _processed_forecast("Gijón", forecast_date, 18),
+            "oviedo": _processed_forecast("Oviedo", forecast_date, 8),
+        }
+    )
+    model = MobileWeatherViewModel(service=StubForecastService(batch))
+    model.activity_profile = "hiking"
+
+    with patch(
+        "src.mobile.view_model.get_top_locations_for_date",
+        wraps=get_top_locations_for_date,
+    ) as mock_rank:
+        model.load()
+        top = model.ranked_locations()
+        assert model.selected_location() == top[0]
+        assert model.ranked_locations(1) == top[:1]
+        assert mock_rank.call_count == 1
+
+        model.load()
+        model.ranked_locations()
+        assert mock_rank.call_count == 2
+
+
+def test_rankings_from_earlier_half_hours_are_evicted():
+    forecast_date = get_current_date() + timedelta(days=1)
+    batch = ForecastBatch(
+        forecasts={"gijon": _processed_forecast("Gijón", forecast_date, 18)}
+    )
+    model = MobileWeatherViewModel(service=StubForecastService(batch))
+    earlier = get_current_datetime().replace(hour=9, minute=0)
+    later = earlier.replace(minute=45)
+
+    with patch("src.mobile.view_model.get_current_datetime", return_value=earlier):
+        model.load()
+        model.select_activity_profile("hiking")
+        model.ranked_locations()
+    assert len(model._rankings) == 2
+    with patch("src.mobile.view_model.get_current_datetime", return_value=later):
+        model.ranked_locations()
+
+    assert list(model._rankings) == [
+        (forecast_date, "hiking", get_ranking_time_slot(later))
+    ]
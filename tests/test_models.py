@@ -3,6 +3,7 @@ Tests for data models including HourlyWeather and DailyReport.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -111,3 +112,17 @@ def test_hourly_weather_hour_extraction(create_hour):
     hour = create_hour(time=test_time)
 
     assert hour.hour == 14
+
+
+def test_daily_report_weather_description_is_computed_once(create_hour):
+    hours = [create_hour(datetime(2024, 3, 15, 12, 0), temp=20)]
+    report = DailyReport(datetime(2024, 3, 15), hours, "Test")
+
+    with patch.object(
+        DailyReport, "_get_weather_description", return_value="Pleasant"
+    ) as mock_describe:
+        first = report.weather_description
+        second = report.weather_description
+
+    assert first == second == "Pleasant"
+    mock_describe.assert_called_once_with()
@@ -5,13 +5,18 @@ import pytest
 from src.core.scoring import (
     ACTIVITY_BEACH_DAY,
     ACTIVITY_HIKING,
+    TEMP_RANGES,
+    WIND_RANGES,
+    _get_value_from_ranges,
+    _range_lookup,
     beach_day_score,
     beach_precip_probability_score,
+    cloud_score,
+    fill_activity_scores,
     get_activity_profile_key,
     get_activity_profile_label,
     get_activity_score,
     get_rating_info,
-    cloud_score,
     normalize_score,
     precip_amount_score,
     precip_probability_score,
@@ -171,8 +176,37 @@ def test_activity_score_applies_risk_to_hiking(create_hour):
     assert get_activity_score(hour, ACTIVITY_HIKING) == 2
 
 
+def test_activity_score_does_not_modify_the_hour(create_hour):
+    hour = create_hour(time=datetime(2024, 3, 15, 12), total_score=12)
+
+    assert get_activity_score(hour, ACTIVITY_BEACH_DAY) == 20
+    assert hour.activity_scores == {}
+
+
+def test_filled_activity_scores_are_reused(create_hour, monkeypatch):
+    hour = create_hour(time=datetime(2024, 3, 15, 12), total_score=12)
+    fill_activity_scores(hour)
+
+    monkeypatch.setattr(
+        "src.core.scoring.beach_day_score",
+        lambda *args: pytest.fail("beach score was recomputed"),
+    )
+
+    assert get_activity_score(hour, ACTIVITY_BEACH_DAY) == 20
+    assert hour.activity_scores == {ACTIVITY_HIKING: 12, ACTIVITY_BEACH_DAY: 20}
+
+
 def test_beach_rating_and_normalization_use_beach_thresholds():
     assert get_rating_info(21, ACTIVITY_BEACH_DAY) == "Very Good"
     assert get_rating_info(22, ACTIVITY_BEACH_DAY) == "Excellent"
     assert normalize_score(22, ACTIVITY_BEACH_DAY) == 90
     assert normalize_score(26, ACTIVITY_BEACH_DAY) == 100
+
+
+@pytest.mark.parametrize("ranges, inclusive", [(TEMP_RANGES, True), (WIND_RANGES, False)])
+def test_range_lookup_matches_first_match_scan(ranges, inclusive):
+    lookup = _range_lookup(ranges, inclusive)
+    values = [None, "n/a", float("nan"), -100, 100] + [v / 4 for v in range(-80, 200)]
+
+    for value in values:
+        assert lookup(value) == _get_value_from_ranges(value, ranges, inclusive)
@@ -7,8 +7,13 @@ from unittest.mock import Mock, patch
 import requests
 
 from src.core.locations import Location
-from src.core.config import PROJECT_URL, USER_AGENT
-from src.core.weather_api import _make_request, fetch_weather_data
+from src.core.config import API_URL, API_URL_COMPACT, PROJECT_URL, USER_AGENT
+from src.core.weather_api import (
+    _make_request,
+    create_session,
+    fetch_weather_data,
+    fetch_weather_data_cached,
+)
 
 
 def test_fetch_weather_data_invalid_location():
@@ -235,3 +240,163 @@ def test_fetch_weather_data_complete_endpoint_null_properties():
         assert result == sufficient_data
         assert mock_request.call_count == 2
 
+
+def test_fetch_weather_data_cached_uses_fresh_cache():
+    """Test that a cache hit skips the network request."""
+    location = Location("test", "Test", 40.0, -3.0)
+    cached_data = {"properties": {"timeseries": []}}
+
+    with patch("src.core.weather_api.get_cached", return_value=cached_data), \
+         patch("src.core.weather_api.fetch_weather_data") as mock_fetch:
+        result = fetch_weather_data_cached(location)
+
+    assert result == cached_data
+    mock_fetch.assert_not_called()
+
+
+def test_fetch_weather_data_cached_stores_successful_fetch():
+    """Test that a cache miss fetches and stores the response."""
+    location = Location("test", "Test", 40.0, -3.0)
+    fetched_data = {"properties": {"timeseries": []}}
+
+    validators = {"url": "https://example.test", "ETag": '"v1"'}
+
+    with patch("src.core.weather_api.get_cached", return_value=None), \
+         patch("src.core.weather_api.get_cached_validators", return_value={}), \
+         patch(
+             "src.core.weather_api._fetch_weather_data_with_validators",
+             return_value=(fetched_data, validators),
+         ), \
+         patch("src.core.weather_api.put_cached") as mock_put:
+        result = fetch_weather_data_cached(location)
+
+    assert result == fetched_data
+    mock_put.assert_called_once_with("test", fetched_data, validators)
+
+
+def test_fetch_weather_data_cached_does_not_store_failures():
+    """Test that failed fetches are not written to the cache."""
+    location = Location("test", "Test", 40.0, -3.0)
+
+    with patch("src.core.weather_api.get_cached", return_value=None), \
+         patch("src.core.weather_api.get_cached_validators", return_value={}), \
+         patch(
+             "src.core.weather_api._fetch_weather_data_with_validators",
+             return_value=(None, {}),
+         ), \
+         patch("src.core.weather_api.put_cached") as mock_put:
+        assert fetch_weather_data_cached(location) is None
+
+    mock_put.assert_not_called()
+
+
+def test_fetch_weather_data_cached_reuses_stale_copy_on_not_modified():
+    """Test that a 304 answer to a conditional GET reuses the stale payload."""
+    location = Location("test", "Test", 40.0, -3.0)
+    stale_data = {"properties": {"timeseries": []}}
+    validators = {"url": "https://example.test", "Last-Modified": "Tue, 01 Oct 2024"}
+    session = Mock()
+    session.get.return_value.status_code = 304
+
+    with patch("src.core.weather_api.get_cached", side_effect=[None, stale_data]), \
+         patch("src.core.weather_api.get_cached_validators", return_value=validators), \
+         patch("src.core.weather_api.touch_cached") as mock_touch, \
+         patch("src.core.weather_api.put_cached") as mock_put:
+        result = fetch_weather_data_cached(location, session)
+
+    assert result == stale_data
+    session.get.assert_called_once_with(
+        "https://example.test",
+        headers={"User-Agent": USER_AGENT, "If-Modified-Since": "Tue, 01 Oct 2024"},
+        timeout=10,
+    )
+    mock_touch.assert_called_once_with("test")
+    mock_put.assert_not_called()
+
+
+def test_fetch_weather_data_cached_stores_changed_revalidated_payload():
+    """Test that a 200 answer to a conditional GET replaces the cached copy."""
+    location = Location("test", "Test", 40.0, -3.0)
+    new_data = {"properties": {"timeseries": [{"time": "t"} for _ in range(10)]}}
+    session = Mock()
+    response = session.get.return_value
+    response.status_code = 200
+    response.json.return_value = new_data
+    response.headers = {"ETag": '"v2"'}
+
+    with patch("src.core.weather_api.get_cached", side_effect=[None, {"old": True}]), \
+         patch(
+             "src.core.weather_api.get_cached_validators",
+             return_value={"url": "https://example.test", "ETag": '"v1"'},
+         ), \
+         patch("src.core.weather_api.put_cached") as mock_put:
+        result = fetch_weather_data_cached(location, session)
+
+    assert result == new_data
+    assert session.get.call_count == 1
+    mock_put.assert_called_once_with(
+        "test", new_data, {"url": "https://example.test", "ETag": '"v2"'}
+    )
+
+
+def test_make_request_uses_shared_session():
+    """Test that _make_request sends through a provided session."""
+    location = Location("test", "Test", 40.0, -3.0)
+    headers = {"User-Agent": "TestAgent"}
+    session = Mock()
+    session.get.return_value.json.return_value = {"test": "data"}
+
+    with patch("requests.get") as mock_get:
+        result = _make_request("http://test.url", location, headers, session)
+
+    assert result == {"test": "data"}
+    session.get.assert_called_once_with("http://test.url", headers=headers, timeout=10)
+    mock_get.assert_not_called()
+
+
+def test_make_request_collects_response_validators():
+    """Test that _make_request reports validators for a decoded response."""
+    location = Location("test", "Test", 40.0, -3.0)
+    session = Mock()
+    session.get.return_value.json.return_value = {"test": "data"}
+    session.get.return_value.headers = {"ETag": '"v1"'}
+    validators = {}
+
+    result = _make_request("http://test.url", location, {}, session, validators)
+
+    assert result == {"test": "data"}
+    assert validators == {"url": "http://test.url", "ETag": '"v1"'}
+
+
+def test_create_session_sizes_https_pool():
+    """Test that the shared session keeps enough pooled connections."""
+    session = create_session(pool_maxsize=8)
+
+    adapter = session.get_adapter("https://api.met.no/")
+    assert adapter._pool_maxsize == 8
+
+
+def test_fetch_weather_data_cached_sparse_revalidation_skips_that_endpoint():
+    """Test that a sparse 200 on revalidation falls back to compact only."""
+    location = Location("test", "Test", 40.0, -3.0)
+    complete_url = f"{API_URL}?lat=40.0&lon=-3.0"
+    compact_data = {"properties": {"timeseries": [{"time": "t"} for _ in range(10)]}}
+    session = Mock()
+    sparse = Mock(status_code=200, headers={})
+    sparse.json.return_value = {"properties": {"timeseries": []}}
+    compact = Mock(status_code=200, headers={})
+    compact.json.return_value = compact_data
+    session.get.side_effect = [sparse, compact]
+
+    with patch("src.core.weather_api.get_cached", side_effect=[None, {"old": True}]), \
+         patch(
+             "src.core.weather_api.get_cached_validators",
+             return_value={"url": complete_url, "ETag": '"v1"'},
+         ), \
+         patch("src.core.weather_api.put_cached") as mock_put:
+        result = fetch_weather_data_cached(location, session)
+
+    assert result == compact_data
+    requested = [call.args[0] for call in session.get.call_args_list]
+    assert requested == [complete_url, f"{API_URL_COMPACT}?lat=40.0&lon=-3.0"]
+    mock_put.assert_called_once_with("test", compact_data, {})